@@ -18,6 +18,11 @@ setup(
         "Pillow>=11.0.0",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.9.0",
+            "ciso8601>=2.3.0",
+            "ijson>=3.2.0",
+        ],
         "dev": [
             "pytest>=8.0.0",
             "pytest-cov>=4.1.0",
@@ -69,21 +69,27 @@ class CSVParser:
         self.delimiter = self._detect_delimiter()
         
         # Parse file
-        with open(self.file_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f, delimiter=self.delimiter)
-            self.headers = reader.fieldnames
+        with open(self.file_path, 'r', encoding='utf-8', buffering=1 << 20) as f:  # 1 MiB read buffer / 1 MiB 读取缓冲区
+            reader = csv.reader(f, delimiter=self.delimiter)
             
-            # Clean headers (remove whitespace)
-            # 清理列标题（移除空白字符）
-            self.headers = [h.strip() if h else h for h in self.headers]
+            # Clean headers once (remove whitespace), not per row
+            # 仅清理一次列标题（移除空白字符），而非每行清理
+            self.headers = [h.strip() if h else h for h in next(reader, [])]
+            width = len(self.headers)
             
-            # Read all rows
+            # Read all rows, zipping values onto the cleaned headers
+            # 读取所有行，将值与已清理的列标题配对
             self.rows = []
-            for row in reader:
-                # Clean values (remove whitespace)
-                # 清理值（移除空白字符）
-                cleaned_row = {k.strip() if k else k: v.strip() if v else v 
-                              for k, v in row.items()}
+            for values in reader:
+                if not values:  # Skip blank lines / 跳过空行
+                    continue
+                # Clean values (remove whitespace); missing trailing cells are None
+                # 清理值（移除空白字符）；缺失的尾部单元格为 None
+                cleaned_row = dict(zip(self.headers, [v.strip() if v else v for v in values]))
+                if len(values) < width:
+                    cleaned_row.update(dict.fromkeys(self.headers[len(values):]))
+                elif len(values) > width:
+                    cleaned_row[None] = values[width:]  # Extra cells, as csv.DictReader does / 多余单元格，与 csv.DictReader 一致
                 self.rows.append(cleaned_row)
         
         return self.headers, self.rows
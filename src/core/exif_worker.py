@@ -8,17 +8,29 @@ Worker thread for asynchronous ExifTool operations
 from PySide6.QtCore import QThread, Signal, QObject
 from typing import List, Dict, Any, Optional
 import subprocess
-import json
 import time
 import os
 import platform
 import concurrent.futures
 from src.utils.argfile_util import ArgfileManager
+from src.utils.parsing import loads
+
 
 # Windows-specific flag to hide console window for subprocesses
 # Windows 特定的标志，用于隐藏子进程的控制台窗口
 CREATE_NO_WINDOW = 0x08000000 if platform.system() == "Windows" else 0
 
+# ExifTool stderr messages that no retry can fix; anything else is retried
+# 重试也无法解决的 ExifTool stderr 消息；其他错误均会重试
+_PERMANENT_ERRORS = (
+    b'File not found',
+    b'Invalid tag name',
+    b'is not defined',
+    b'Unknown file type',
+    b'Not a valid',
+    b'is not supported',
+)
+
 from src.utils.logger import get_logger
 from src.core.config import get_config
 from src.utils.i18n import tr
@@ -58,10 +70,30 @@ class ExifToolWorker(QObject):
         # Use config values / 使用配置值
         self.exiftool_path = exiftool_path or config.get('exiftool_path', 'exiftool')
         self.MAX_RETRIES = config.get('exiftool_max_retries', 3)
-        self.RETRY_DELAY = 0.5  # Fixed delay / 固定延迟
+        self.RETRY_DELAY = 0.5  # Base delay, doubled per attempt / 基础延迟，每次重试翻倍
+        
+        # Tags requested by read_exif_sync (extend to read more) / read_exif_sync 读取的标签（可扩展）
+        self._read_tags: List[str] = [
+            "DateTimeOriginal", "CreateDate", "DateTime", "DateTimeDigitized",
+            "GPSLatitude", "GPSLongitude"
+        ]
+        
+        # Tags requested by read_exif: everything the photo table, inspector and matcher read.
+        # Pinning ~25 tags instead of every tag keeps the JSON and each cached EXIF dict small.
+        # read_exif 读取的标签：照片表格、检查器和匹配器所需的全部标签。
+        # 只读取约 25 个标签而非全部标签，可缩小 JSON 输出及每个缓存的 EXIF 字典。
+        self._batch_read_tags: List[str] = [
+            "Make", "Model", "LensMake", "LensModel", "SerialNumber",
+            "FNumber", "Aperture", "ExposureTime", "ShutterSpeed", "ISO",
+            "FocalLength", "FocalLengthIn35mmFormat",
+            "DateTimeOriginal", "CreateDate", "DateTime", "DateTimeDigitized",
+            "GPSLatitude", "GPSLatitudeRef", "GPSLongitude", "GPSLongitudeRef",
+            "Film", "ImageDescription", "UserComment"
+        ]
         
         self.task_queue: List[Dict[str, Any]] = []
         self._is_running = False
+        self._last_progress = -1  # Last emitted progress value / 上次发送的进度值
         self.last_result: Optional[Dict[str, Any]] = None  # Store last batch write result
     
     def read_exif(self, file_paths: List[str]) -> None:
@@ -84,13 +116,14 @@ class ExifToolWorker(QObject):
             self.log_message.emit(tr("Synchronizing metadata for {count} files...").format(count=total_files))
             
             # Create argfile for batch reading
-            argfile_path = ArgfileManager.create_read_args(file_paths)
+            argfile_path = ArgfileManager.create_read_args(file_paths, self._batch_read_tags)
             
             # Execute exiftool command once for all files
             # Added -fast2 to skip MakerNotes for maximum speed
-            cmd = [self.exiftool_path, "-fast2", "-@", argfile_path]
+            cmd = [self.exiftool_path, "-fast2", "-api", "largefilesupport=1", "-@", argfile_path]
             
-            self.progress.emit(10) # Start progress
+            self._last_progress = -1
+            self._emit_progress(10) # Start progress
             
             result = subprocess.run(
                 cmd,
@@ -100,29 +133,26 @@ class ExifToolWorker(QObject):
                 creationflags=CREATE_NO_WINDOW
             )
             
-            self.progress.emit(90) # Command finished
+            self._emit_progress(90) # Command finished
             
             stdout = result.stdout.decode("utf-8", errors="replace")
             stderr = result.stderr.decode("utf-8", errors="replace")
             
             if result.returncode == 0:
                 try:
-                    data = json.loads(stdout)
+                    data = loads(stdout)
                     # ExifTool returns a list of dicts. Map them back to file paths.
                     # ExifTool 返回字典列表，将其映射回文件路径。
                     # Note: SourceFile in JSON is usually the normalized path.
+                    # Normalize with pure string ops (abspath hits the filesystem on Windows)
+                    # 使用纯字符串操作进行规范化（Windows 上 abspath 会访问文件系统）
+                    # Reversed so the first of several equivalent inputs wins / 反向构建，使多个等价输入中第一个生效
+                    path_map = {self._normalize_path(p): p for p in reversed(file_paths)}
                     for entry in data:
                         source_path = entry.get('SourceFile')
                         if source_path:
-                            # Try to match original path by normalizing both
-                            found = False
-                            for original in file_paths:
-                                if os.path.abspath(original) == os.path.abspath(source_path):
-                                    results[original] = entry
-                                    found = True
-                                    break
-                            if not found:
-                                results[source_path] = entry
+                            original = path_map.get(self._normalize_path(source_path))
+                            results[original or source_path] = entry
                 except Exception as e:
                     self.error_occurred.emit(f"JSON parse error: {e}")
                     logger.error(f"Failed to parse ExifTool JSON output: {e}")
@@ -131,7 +161,7 @@ class ExifToolWorker(QObject):
                 logger.error(f"ExifTool batch read failed: {stderr}")
             
             self.read_finished.emit(results)
-            self.progress.emit(100)
+            self._emit_progress(100)
             
         except Exception as e:
             logger.error(f"Batch read failed: {e}", exc_info=True)
@@ -141,6 +171,27 @@ class ExifToolWorker(QObject):
                 ArgfileManager.cleanup(argfile_path)
             self.finished.emit()
     
+    def _emit_progress(self, pct: int) -> None:
+        """
+        Emit progress only when the integer percentage changes
+        仅在整数百分比变化时发送进度信号（减少跨线程信号开销）
+        """
+        if pct != self._last_progress:
+            self._last_progress = pct
+            self.progress.emit(pct)
+    
+    @staticmethod
+    def _normalize_path(path: str) -> str:
+        """
+        Normalize a path for comparison without touching the filesystem
+        在不访问文件系统的情况下规范化路径以便比较
+        """
+        path = os.fspath(path)
+        # Only relative paths need abspath (cwd lookup) / 仅相对路径需要 abspath
+        if not os.path.isabs(path):
+            path = os.path.abspath(path)
+        return os.path.normcase(os.path.normpath(path))
+    
     def read_exif_sync(self, file_path: str) -> Dict[str, Any]:
         """
         Read EXIF data from file synchronously / 同步读取文件的EXIF数据
@@ -153,7 +204,11 @@ class ExifToolWorker(QObject):
         """
         try:
             # Use flat keys (no -G) for consistency with PhotoDataModel
-            cmd = [self.exiftool_path, "-j", "-a", file_path]
+            # Only request the needed tags and skip duplicates (-a) to keep the JSON small
+            # 仅请求所需标签并跳过重复标签 (-a)，以缩小 JSON 输出
+            cmd = [self.exiftool_path, "-j", "-fast2", "-api", "largefilesupport=1"]
+            cmd.extend(f"-{tag}" for tag in self._read_tags)
+            cmd.append(file_path)
             result = subprocess.run(
                 cmd,
                 capture_output=True,
@@ -165,7 +220,7 @@ class ExifToolWorker(QObject):
             stdout = result.stdout.decode("utf-8", errors="replace")
             
             if result.returncode == 0:
-                data = json.loads(stdout)
+                data = loads(stdout)
                 if data and len(data) > 0:
                     return data[0]
             
@@ -195,10 +250,11 @@ class ExifToolWorker(QObject):
             try:
                 logger.debug(f"ExifTool attempt {attempt + 1}/{self.MAX_RETRIES}: {' '.join(cmd[:3])}...")
                 
+                # Raw bytes: stderr is only decoded on failure / 原始字节：仅在失败时解码 stderr
                 result = subprocess.run(
                     cmd,
                     capture_output=True,
-                    text=True,
+                    text=False,
                     timeout=timeout,
                     creationflags=CREATE_NO_WINDOW
                 )
@@ -208,35 +264,30 @@ class ExifToolWorker(QObject):
                         logger.info(f"ExifTool succeeded on attempt {attempt + 1}")
                     return result
                 
-                # Command failed, prepare for retry / 命令失败，准备重试
-                last_error = result.stderr or "Unknown error"
-                logger.warning(f"ExifTool attempt {attempt + 1} failed: {last_error}")
+                last_error = result.stderr.decode('utf-8', errors='replace').strip() or "Unknown error"
+                
+                # Bad tag, missing or unsupported file: retrying won't help
+                # 无效标签、文件不存在或不支持的文件：重试无济于事
+                if any(msg in result.stderr for msg in _PERMANENT_ERRORS):
+                    logger.warning(f"ExifTool attempt {attempt + 1} failed permanently: {last_error}")
+                    raise RuntimeError(f"ExifTool failed: {last_error}")
                 
-                # Wait before retry (exponential backoff) / 重试前等待（指数退避）
-                if attempt < self.MAX_RETRIES - 1:
-                    delay = self.RETRY_DELAY * (2 ** attempt)
-                    logger.debug(f"Waiting {delay}s before retry")
-                    time.sleep(delay)
+                # Anything else (locked file, I/O hiccup...) may be transient / 其他错误（文件被锁定、I/O 抖动等）可能是暂时性的
+                logger.warning(f"ExifTool attempt {attempt + 1} failed: {last_error}")
             
-            except subprocess.TimeoutExpired as e:
+            except subprocess.TimeoutExpired:
                 last_error = f"Timeout after {timeout}s"
                 logger.warning(f"ExifTool attempt {attempt + 1} timed out")
-                
-                if attempt < self.MAX_RETRIES - 1:
-                    delay = self.RETRY_DELAY * (2 ** attempt)
-                    time.sleep(delay)
-                else:
-                    raise RuntimeError(f"ExifTool failed after {self.MAX_RETRIES} attempts: {last_error}")
             
-            except Exception as e:
+            except OSError as e:
                 last_error = str(e)
                 logger.error(f"ExifTool attempt {attempt + 1} error: {e}")
-                
-                if attempt < self.MAX_RETRIES - 1:
-                    delay = self.RETRY_DELAY * (2 ** attempt)
-                    time.sleep(delay)
-                else:
-                    raise RuntimeError(f"ExifTool failed after {self.MAX_RETRIES} attempts: {last_error}")
+            
+            # Wait before retry (exponential backoff) / 重试前等待（指数退避）
+            if attempt < self.MAX_RETRIES - 1:
+                delay = self.RETRY_DELAY * (2 ** attempt)
+                logger.debug(f"Waiting {delay}s before retry")
+                time.sleep(delay)
         
         raise RuntimeError(f"ExifTool failed after {self.MAX_RETRIES} attempts: {last_error}")
     
@@ -291,7 +342,6 @@ class ExifToolWorker(QObject):
         Args:
             write_tasks: List of dicts with 'file_path' and 'exif_data' / 包含 'file_path' 和 'exif_data' 的字典列表
         """
-        temp_files = []
         try:
             total_tasks = len(write_tasks)
             if not write_tasks:
@@ -299,7 +349,8 @@ class ExifToolWorker(QObject):
                 return
 
             self.log_message.emit(tr("Starting parallel batch write for {count} tasks...").format(count=total_tasks))
-            self.progress.emit(5)
+            self._last_progress = -1
+            self._emit_progress(5)
             
             # 1. Determine concurrency level / 确定并发数
             # Max 4 workers to avoid disk thrashing and high RAM usage
@@ -315,15 +366,16 @@ class ExifToolWorker(QObject):
             
             # 3. Define the worker function for each chunk / 定义每个分片的执行函数
             def process_chunk(chunk_tasks):
-                chunk_argfile = None
                 try:
                     overwrite = config.get('overwrite_original', True)
                     preserve_date = config.get('preserve_modify_date', True)
                     
-                    # Pass False/False to create_write_args so flags are NOT in the file head
-                    chunk_argfile = ArgfileManager.create_write_args(chunk_tasks, False, False)
+                    # Build the argfile in memory and pipe it via stdin ("-@ -"), no temp file on disk
+                    # 在内存中构建 argfile 并通过 stdin 管道传入（"-@ -"），无需磁盘临时文件
+                    # Pass False/False so flags are NOT in the argfile head
+                    argfile_bytes = ArgfileManager.build_write_args(chunk_tasks, False, False)
                     
-                    cmd = [self.exiftool_path, "-@", chunk_argfile]
+                    cmd = [self.exiftool_path, "-@", "-"]
                     
                     # Use -common_args to enforce flags across ALL -execute blocks
                     # Must be the LAST option on the command line
@@ -341,25 +393,22 @@ class ExifToolWorker(QObject):
                     
                     result = subprocess.run(
                         cmd,
+                        input=argfile_bytes,
                         capture_output=True,
-                        text=True,
                         timeout=max(60, len(chunk_tasks) * 2.0),
                         creationflags=CREATE_NO_WINDOW
                     )
                     
-                    # Return path for cleanup and status
                     return {
                         "success": result.returncode == 0,
-                        "error": result.stderr if result.returncode != 0 else None,
-                        "tasks": chunk_tasks,
-                        "argfile": chunk_argfile
+                        "error": result.stderr.decode("utf-8", errors="replace") if result.returncode != 0 else None,
+                        "tasks": chunk_tasks
                     }
                 except Exception as e:
                     return {
                         "success": False,
                         "error": str(e),
-                        "tasks": chunk_tasks,
-                        "argfile": chunk_argfile
+                        "tasks": chunk_tasks
                     }
 
             # 4. Execute parallel tasks / 执行并行任务
@@ -372,7 +421,6 @@ class ExifToolWorker(QObject):
                 completed = 0
                 for future in concurrent.futures.as_completed(future_to_chunk):
                     res = future.result()
-                    temp_files.append(res.get('argfile'))
                     
                     succ = res.get('success', False)
                     err_msg = res.get('error')
@@ -385,7 +433,7 @@ class ExifToolWorker(QObject):
                         })
                     
                     completed += 1
-                    self.progress.emit(int(10 + (completed / len(chunks)) * 80))
+                    self._emit_progress(int(10 + (completed / len(chunks)) * 80))
 
             # 5. Emit final results / 发送最终结果
             result_dict = {
@@ -401,15 +449,11 @@ class ExifToolWorker(QObject):
             
             self.last_result = result_dict
             self.write_finished.emit(result_dict)
-            self.progress.emit(100)
+            self._emit_progress(100)
         
         except Exception as e:
             logger.critical(f"Exception in parallel_batch_write: {e}", exc_info=True)
             self.error_occurred.emit(f"Parallel batch write failed: {str(e)}")
         finally:
-            # Cleanup all temp files
-            for f in temp_files:
-                if f:
-                    ArgfileManager.cleanup(f)
             self.finished.emit()
 
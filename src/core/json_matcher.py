@@ -15,6 +15,9 @@ from src.core.photo_model import PhotoItem
 
 logger = logging.getLogger(__name__)
 
+# EXIF date fields probed in priority order / 按优先级探测的 EXIF 日期字段
+_DATE_FIELDS = ('DateTimeOriginal', 'CreateDate', 'DateTime', 'DateTimeDigitized')
+
 
 class PhotoMatcher:
     """
@@ -51,7 +54,11 @@ class PhotoMatcher:
             log_entry is None if no match found / 如果未找到匹配则 log_entry 为 None
         """
         matches: List[Tuple[PhotoItem, Optional[FilmLogEntry]]] = []
-        used_entries = set()
+        
+        # Cache entry timestamps and usage flags up front / 预先缓存条目时间戳和使用标记
+        entry_ts = [e.timestamp for e in log_entries]
+        used = bytearray(len(entry_ts))
+        tolerance = self.time_tolerance
         
         for photo in photos:
             best_match = None
@@ -64,20 +71,21 @@ class PhotoMatcher:
                 continue
             
             # Find closest log entry within tolerance / 在容差范围内找到最接近的日志条目
-            for idx, entry in enumerate(log_entries):
-                if idx in used_entries or entry.timestamp is None:
+            for idx in range(len(entry_ts)):
+                et = entry_ts[idx]
+                if et is None or used[idx]:
                     continue
                 
-                time_diff = abs(photo_time - entry.timestamp)
+                time_diff = abs(photo_time - et)
                 
-                if time_diff <= self.time_tolerance:
+                if time_diff <= tolerance:
                     if best_diff is None or time_diff < best_diff:
-                        best_match = entry
+                        best_match = log_entries[idx]
                         best_diff = time_diff
                         best_idx = idx
             
             if best_match:
-                used_entries.add(best_idx)
+                used[best_idx] = 1
                 matches.append((photo, best_match))
                 logger.debug(f"Matched {photo.file_name} to entry (diff: {best_diff})")
             else:
@@ -142,7 +150,14 @@ class PhotoMatcher:
         Returns:
             List of (photo, log_entry) tuples / (照片, 日志条目) 元组列表
         """
-        if prefer_timestamp:
+        # Computed once; timestamp matching cannot succeed without any timestamps
+        # 仅计算一次；没有任何时间戳时时间戳匹配不可能成功
+        has_any_ts = any(entry.timestamp for entry in log_entries)
+        
+        if prefer_timestamp and not has_any_ts:
+            logger.info("No timestamps in log entries, using sequence matching")
+            matches = self.match_by_sequence(photos, log_entries)
+        elif prefer_timestamp:
             matches = self.match_by_timestamp(photos, log_entries)
             
             # Check if we have many unmatched photos / 检查是否有许多未匹配的照片
@@ -157,7 +172,7 @@ class PhotoMatcher:
             
             # Check if we have many unmatched due to sequence / 检查是否因顺序而有许多未匹配
             unmatched_count = sum(1 for _, entry in matches if entry is None)
-            if unmatched_count > len(photos) * 0.3 and any(entry.timestamp for entry in log_entries):
+            if unmatched_count > len(photos) * 0.3 and has_any_ts:
                 logger.info(f"Sequence matching: {unmatched_count} unmatched photos; timestamp data available in log entries")
                 logger.debug("Keeping sequence-first strategy as per v0.3.1 design for film photography")
         
@@ -178,17 +193,16 @@ class PhotoMatcher:
             return None
         
         # Try multiple EXIF date fields / 尝试多个 EXIF 日期字段
-        date_fields = ['DateTimeOriginal', 'CreateDate', 'DateTime', 'DateTimeDigitized']
-        
-        for field in date_fields:
-            if field in photo.exif_data:
-                try:
-                    date_str = photo.exif_data[field]
-                    # EXIF date format: "YYYY:MM:DD HH:MM:SS"
-                    return datetime.strptime(date_str, '%Y:%m:%d %H:%M:%S')
-                except Exception as e:
-                    logger.warning(f"Could not parse date '{date_str}': {e}")
-                    continue
+        exif_data = photo.exif_data
+        for field in _DATE_FIELDS:
+            date_str = exif_data.get(field)
+            if date_str is None:
+                continue
+            try:
+                # EXIF date format: "YYYY:MM:DD HH:MM:SS"
+                return datetime.strptime(date_str, '%Y:%m:%d %H:%M:%S')
+            except Exception as e:
+                logger.warning(f"Could not parse date '{date_str}': {e}")
         
         return None
     
@@ -207,7 +221,7 @@ class PhotoMatcher:
             Statistics dictionary / 统计字典
         """
         total = len(matches)
-        matched = sum(1 for _, entry in matches if entry is not None)
+        matched = sum(1 for m in matches if m[1] is not None)
         unmatched = total - matched
         
         return {
@@ -7,14 +7,42 @@ Lightme/Logbook 胶片记录文件的 JSON 解析器
 
 import json
 from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 import logging
+import os
+import sys
+from src.utils.parsing import JsonArrayStream, ijson, loads, parse_timestamp
 
 logger = logging.getLogger(__name__)
 
+# Files larger than this are streamed when ijson is available / 安装 ijson 时，超过此大小的文件将流式解析
+_STREAM_THRESHOLD = 64 * 1024 * 1024
 
-@dataclass
+# Object keys that may wrap the entry array, in priority order / 可能包装条目数组的对象键（按优先级）
+_WRAPPER_KEYS = ('entries', 'frames', 'shots')
+
+# Candidate JSON keys per field, probed in priority order / 各字段的候选 JSON 键（按优先级探测）
+_TIMESTAMP_FIELDS = ('timestamp', 'time', 'date', 'datetime', 'shot_time')
+_FRAME_FIELDS = ('frame', 'frame_number', 'number', 'shot_number')
+_CAMERA_FIELDS = ('camera', 'body', 'camera_body', 'camera_model')
+_LENS_FIELDS = ('lens', 'lens_model', 'optic')
+_FILM_FIELDS = ('film_stock', 'film', 'film_type', 'emulsion')
+_SHUTTER_FIELDS = ('shutter_speed', 'shutter', 'exposure_time')
+_ISO_FIELDS = ('iso', 'film_speed')
+_NOTES_FIELDS = ('notes', 'comment')
+
+# Sentinel for "key absent", distinct from a present None / 表示"键不存在"的哨兵，区别于存在但为 None
+_MISSING = object()
+
+# Every key _parse_entry reads; excluded from raw_data / _parse_entry 读取的所有键；不计入 raw_data
+_EXTRACTED_KEYS = frozenset(
+    _TIMESTAMP_FIELDS + _FRAME_FIELDS + _CAMERA_FIELDS + _LENS_FIELDS + _FILM_FIELDS
+    + _SHUTTER_FIELDS + _ISO_FIELDS + _NOTES_FIELDS
+    + ('aperture', 'f_number', 'focal_length', 'location')
+)
+
+@dataclass(slots=True)
 class FilmLogEntry:
     """
     Single film log entry from JSON
@@ -41,8 +69,8 @@ class FilmLogEntry:
     notes: Optional[str] = None
     location: Optional[str] = None
     
-    # Raw JSON for custom fields / 原始 JSON 用于自定义字段
-    raw_data: Dict[str, Any] = None
+    # Unrecognized JSON fields, only kept when requested / 未识别的 JSON 字段，仅在需要时保留
+    raw_data: Optional[Dict[str, Any]] = field(default=None, repr=False)
 
 
 class FilmLogParser:
@@ -51,9 +79,15 @@ class FilmLogParser:
     Lightme/Logbook JSON 导出文件解析器
     """
     
-    def __init__(self):
-        """Initialize parser / 初始化解析器"""
+    def __init__(self, keep_raw: bool = False):
+        """
+        Initialize parser / 初始化解析器
+        
+        Args:
+            keep_raw: Keep unrecognized fields in raw_data / 在 raw_data 中保留未识别的字段
+        """
         self.entries: List[FilmLogEntry] = []
+        self.keep_raw = keep_raw
     
     def parse_file(self, file_path: str) -> List[FilmLogEntry]:
         """
@@ -70,8 +104,15 @@ class FilmLogParser:
             ValueError: If JSON format is invalid / 如果 JSON 格式无效
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if ijson is not None and os.path.getsize(file_path) > _STREAM_THRESHOLD:
+                # Stream huge exports entry by entry / 逐条流式解析超大导出文件
+                self.entries = self._parse_stream(file_path)
+                logger.info(f"Parsed {len(self.entries)} entries from {file_path} (streamed)")
+                return self.entries
+            
+            # Read raw bytes; orjson parses UTF-8 bytes directly / 读取原始字节；orjson 直接解析 UTF-8 字节
+            with open(file_path, 'rb') as f:
+                data = loads(f.read())
             
             # Try different JSON structures / 尝试不同的 JSON 结构
             if isinstance(data, list):
@@ -79,14 +120,10 @@ class FilmLogParser:
                 self.entries = [self._parse_entry(entry) for entry in data]
             elif isinstance(data, dict):
                 # Wrapped in object / 包装在对象中
-                if 'entries' in data:
-                    self.entries = [self._parse_entry(entry) for entry in data['entries']]
-                elif 'frames' in data:
-                    self.entries = [self._parse_entry(entry) for entry in data['frames']]
-                elif 'shots' in data:
-                    self.entries = [self._parse_entry(entry) for entry in data['shots']]
-                else:
+                key = next((k for k in _WRAPPER_KEYS if k in data), None)
+                if key is None:
                     raise ValueError("Unknown JSON structure")
+                self.entries = [self._parse_entry(entry) for entry in data[key]]
             else:
                 raise ValueError("JSON must be array or object")
             
@@ -100,6 +137,32 @@ class FilmLogParser:
             logger.error(f"Error parsing JSON: {e}")
             raise
     
+    def _parse_stream(self, file_path: str) -> List[FilmLogEntry]:
+        """
+        Parse a large JSON file incrementally with ijson
+        使用 ijson 增量解析大型 JSON 文件
+        
+        Only one raw entry dict is alive at a time, instead of the whole document.
+        A second pass is made only when a higher-priority wrapper key follows the streamed one.
+        任意时刻只保留一个原始条目字典，而不是整个文档。
+        仅当更高优先级的包装键出现在已流式读取的键之后时才进行第二遍解析。
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                stream = JsonArrayStream(f, _WRAPPER_KEYS)
+                entries = [self._parse_entry(entry) for entry in stream]
+                if stream.key is None:
+                    raise ValueError("Unknown JSON structure")
+                
+                key = next((k for k in _WRAPPER_KEYS if k in stream.arrays), stream.key)
+                if key != stream.key:
+                    f.seek(0)
+                    entries = [self._parse_entry(entry) for entry in JsonArrayStream(f, (key,))]
+                return entries
+        except ijson.JSONError as e:
+            logger.error(f"JSON decode error: {e}")
+            raise ValueError(f"Invalid JSON format: {e}")
+    
     def _parse_entry(self, entry: Dict[str, Any]) -> FilmLogEntry:
         """
         Parse single JSON entry
@@ -111,100 +174,112 @@ class FilmLogParser:
         Returns:
             FilmLogEntry object / FilmLogEntry 对象
         """
-        log_entry = FilmLogEntry(raw_data=entry)
+        log_entry = FilmLogEntry()
+        if self.keep_raw:
+            # Extracted fields already live on the entry; don't pin them twice
+            # 已提取的字段保存在条目属性中，无需重复保留
+            log_entry.raw_data = {k: v for k, v in entry.items() if k not in _EXTRACTED_KEYS}
         
         # Parse timestamp / 解析时间戳
-        timestamp_fields = ['timestamp', 'time', 'date', 'datetime', 'shot_time']
-        for field in timestamp_fields:
-            if field in entry and entry[field]:
-                try:
+        ts_str = self._first_value(entry, _TIMESTAMP_FIELDS)
+        if ts_str:
+            try:
+                if isinstance(ts_str, (int, float)):
+                    # Unix timestamp / Unix 时间戳
+                    log_entry.timestamp = datetime.fromtimestamp(ts_str)
+                elif isinstance(ts_str, str):
                     # Try multiple datetime formats / 尝试多种日期时间格式
-                    ts_str = entry[field]
-                    for fmt in [
-                        '%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S', 
-                        '%Y/%m/%d %H:%M:%S', '%Y-%m-%d %H:%M:%S.%f',
-                        '%Y-%m-%d %H:%M', '%Y/%m/%d %H:%M',
-                        '%Y-%m-%d', '%Y/%m/%d'
-                    ]:
-                        try:
-                            # Handle T separator / 处理 T 分隔符
-                            clean_ts = ts_str.replace('T', ' ')
-                            log_entry.timestamp = datetime.strptime(clean_ts, fmt)
-                            break
-                        except:
-                            continue
-                    if log_entry.timestamp is None and isinstance(ts_str, (int, float)):
-                        # Unix timestamp / Unix 时间戳
-                        log_entry.timestamp = datetime.fromtimestamp(ts_str)
-                except Exception as e:
-                    logger.warning(f"Could not parse timestamp '{entry[field]}': {e}")
-                break
-        
-        # Parse frame number / 解析帧编号
-        frame_fields = ['frame', 'frame_number', 'number', 'shot_number']
-        for field in frame_fields:
-            if field in entry:
+                    log_entry.timestamp = parse_timestamp(ts_str)
+            except Exception as e:
+                logger.warning(f"Could not parse timestamp '{ts_str}': {e}")
+        
+        # Parse frame number (first present key, even if empty) / 解析帧编号（取第一个存在的键，即使为空）
+        value = self._first_present(entry, _FRAME_FIELDS)
+        if value is not _MISSING:
+            # Pre-filter strings so non-integers skip without raising / 预先过滤字符串，非整数直接跳过
+            if not isinstance(value, str) or value.strip().lstrip('+-').replace('_', '').isdecimal():
                 try:
-                    log_entry.frame_number = int(entry[field])
-                except:
+                    log_entry.frame_number = int(value)
+                except (ValueError, TypeError, OverflowError):
                     pass
-                break
         
+        # Roll-level strings repeat across frames; intern them / 胶卷级字符串在各帧间重复，进行驻留
         # Parse camera / 解析相机
-        camera_fields = ['camera', 'body', 'camera_body', 'camera_model']
-        for field in camera_fields:
-            if field in entry and entry[field]:
-                log_entry.camera = str(entry[field])
-                break
+        val = self._first_value(entry, _CAMERA_FIELDS)
+        if val:
+            log_entry.camera = sys.intern(str(val))
         
         # Parse lens / 解析镜头
-        lens_fields = ['lens', 'lens_model', 'optic']
-        for field in lens_fields:
-            if field in entry and entry[field]:
-                log_entry.lens = str(entry[field])
-                break
-        
-        # Parse exposure / 解析曝光
-        if 'aperture' in entry:
-            log_entry.aperture = str(entry['aperture']).replace('f/', '').replace('F', '')
-        elif 'f_number' in entry:
-            log_entry.aperture = str(entry['f_number'])
-        
-        if 'shutter_speed' in entry:
-            log_entry.shutter_speed = str(entry['shutter_speed'])
-        elif 'shutter' in entry:
-            log_entry.shutter_speed = str(entry['shutter'])
-        elif 'exposure_time' in entry:
-            log_entry.shutter_speed = str(entry['exposure_time'])
-        
-        if 'iso' in entry:
-            log_entry.iso = str(entry['iso'])
-        elif 'film_speed' in entry:
-            log_entry.iso = str(entry['film_speed'])
+        val = self._first_value(entry, _LENS_FIELDS)
+        if val:
+            log_entry.lens = sys.intern(str(val))
+        
+        # Parse exposure (one dict probe per candidate key) / 解析曝光（每个候选键仅查找一次字典）
+        val = entry.get('aperture', _MISSING)
+        if val is not _MISSING:
+            log_entry.aperture = sys.intern(str(val).replace('f/', '').replace('F', ''))
+        else:
+            val = entry.get('f_number', _MISSING)
+            if val is not _MISSING:
+                log_entry.aperture = sys.intern(str(val))
+        
+        val = self._first_present(entry, _SHUTTER_FIELDS)
+        if val is not _MISSING:
+            log_entry.shutter_speed = sys.intern(str(val))
+        
+        val = self._first_present(entry, _ISO_FIELDS)
+        if val is not _MISSING:
+            log_entry.iso = sys.intern(str(val))
         
         # Parse film stock / 解析胶片型号
-        film_fields = ['film_stock', 'film', 'film_type', 'emulsion']
-        for field in film_fields:
-            if field in entry and entry[field]:
-                log_entry.film_stock = str(entry[field])
-                break
+        val = self._first_value(entry, _FILM_FIELDS)
+        if val:
+            log_entry.film_stock = sys.intern(str(val))
         
         # Parse focal length / 解析焦距
-        if 'focal_length' in entry:
-            log_entry.focal_length = str(entry['focal_length'])
+        val = entry.get('focal_length', _MISSING)
+        if val is not _MISSING:
+            log_entry.focal_length = str(val)
         
         # Parse notes / 解析备注
-        if 'notes' in entry:
-            log_entry.notes = str(entry['notes'])
-        elif 'comment' in entry:
-            log_entry.notes = str(entry['comment'])
+        val = self._first_present(entry, _NOTES_FIELDS)
+        if val is not _MISSING:
+            log_entry.notes = str(val)
         
         # Parse location / 解析位置
-        if 'location' in entry:
-            log_entry.location = str(entry['location'])
+        val = entry.get('location', _MISSING)
+        if val is not _MISSING:
+            log_entry.location = str(val)
         
         return log_entry
     
+    @staticmethod
+    def _first_present(entry: Dict[str, Any], fields: tuple) -> Any:
+        """
+        Return the value of the first candidate key present, even if empty (_MISSING if none)
+        返回第一个存在的候选键的值，即使为空（都不存在时返回 _MISSING）
+        """
+        for field in fields:
+            val = entry.get(field, _MISSING)
+            if val is not _MISSING:
+                return val
+        return _MISSING
+    
+    @staticmethod
+    def _first_value(entry: Dict[str, Any], fields: tuple) -> Any:
+        """
+        Return the first non-empty value among the candidate keys
+        返回候选键中第一个非空的值
+        
+        Only the listed keys are probed; the rest of the entry is never touched.
+        仅探测列出的键，不会遍历条目的其他部分。
+        """
+        for field in fields:
+            val = entry.get(field)
+            if val:
+                return val
+        return None
+    
     def get_entries(self) -> List[FilmLogEntry]:
         """Get parsed entries / 获取已解析的条目"""
         return self.entries
@@ -9,16 +9,150 @@ import json
 import re
 import csv
 import logging
+import functools
+import os
+import sys
+from collections import deque
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 import src.utils.gps_utils as gps_utils
+from src.utils.parsing import JsonArrayStream, ijson, loads, parse_timestamp
 
 logger = logging.getLogger(__name__)
 
+# Files larger than this are streamed when ijson is available / 安装 ijson 时，超过此大小的文件将流式解析
+_STREAM_THRESHOLD = 64 * 1024 * 1024
 
-@dataclass
+# Read buffer for streamed text files (CSV/TXT) / 流式文本文件（CSV/TXT）的读取缓冲区大小
+_READ_BUFFER_SIZE = 1 << 20
+
+# Object keys that may wrap the entry array, in priority order / 可能包装条目数组的对象键（按优先级）
+_WRAPPER_KEYS = ('pictures', 'entries', 'frames', 'shots', 'records', 'items')
+# Top-level scalar fields inherited by every entry / 所有条目继承的顶层标量字段
+_CONTEXT_KEYS = ('film', 'film_stock', 'roll_name', 'camera', 'lens', 'speed', 'date', 'shot_date', 'time', 'shooting_date', 'create_time', 'lens_model', 'camera_model')
+
+# JSON field aliases, probed in priority order / JSON 字段别名（按优先级探测）
+# Support both Lightme format and EXIF field names (Lightroom, etc.)
+# Make MUST NOT be in _CAMERA_FIELDS, otherwise it overwrites Model if Model is missing or checked later
+_MAKE_FIELDS = ('Make', 'Manufacturer')
+_LENS_MAKE_FIELDS = ('LensMake',)
+_CAMERA_FIELDS = ('camera_model', 'Model', 'camera', 'body', 'camera_body', 'camera_name')
+_LENS_FIELDS = ('lens', 'lensmodel', 'lens_model', 'LensModel', 'LensMake', 'lens_name', 'optic')
+_APERTURE_FIELDS = ('aperture', 'f_stop', 'f-stop', 'fnumber', 'FNumber', 'MaxApertureValue', 'f_number')
+_SHUTTER_FIELDS = ('shutter_speed', 'shutter', 'shutterspeed', 'exposure_time', 'exposuretime', 'ExposureTime')
+_ISO_FIELDS = ('iso', 'sensitivity', 'ISO', 'ISOSpeed', 'speed', 'film_speed', 'film_rating')
+_FILM_FIELDS = ('film', 'film_stock', 'filmstock', 'emulsion', 'Description', 'ReelName', 'SpectralSensitivity', 'film_type')
+_FOCAL_FIELDS = ('focal_length', 'focallength', 'focal', 'FocalLength')
+_FOCAL_35MM_FIELDS = ('focal_length_35mm', 'focal35mm', '35mm_focal', 'FocalLengthIn35mmFormat')
+_TIMESTAMP_FIELDS = ('timestamp', 'date', 'time', 'datetime', 'DateTimeOriginal', 'shot_time', 'shooting_date', 'create_time', 'created_at')
+_SHOT_DATE_FIELDS = ('shot_date', 'shot_date_str', 'date_string', 'DateString', 'DateTimeOriginal', 'DateTime', 'CreateDate', 'ModifyDate', 'SubSecDateTimeOriginal', 'date', 'time', 'datetime')
+_LOCATION_FIELDS = ('location', 'geo', 'gps', 'GPSInfo', 'GPSLatitude', 'GPSLongitude', 'GPSAltitude', 'GPSLatitudeRef', 'GPSLongitudeRef', 'place', 'address')
+_FRAME_FIELDS = ('frame', 'frame_number', 'number', 'shot_number', 'ImageNumber', 'frame_id')
+_NOTES_FIELDS = ('notes', 'comments', 'comment', 'UserComment', 'Notes', 'remarks', 'description')
+# Coordinate separators with surrounding whitespace, compiled once / 预编译的坐标分隔符（含两侧空白）
+_LOCATION_SPLIT = {',': re.compile(r'\s*,\s*'), ';': re.compile(r'\s*;\s*')}
+# TXT field separators with surrounding whitespace / TXT 字段分隔符（含两侧空白）
+_TXT_SPLIT_PIPE = re.compile(r'\s*\|\s*')
+_TXT_SPLIT_TAB = re.compile(r'[^\S\t]*\t[^\S\t]*')  # Whitespace except tab, so empty columns survive / 不含制表符的空白，保留空列
+# Common value keys in nested objects / 嵌套对象中常见的值键
+_NESTED_VALUE_KEYS = ('name', 'iso', 'formatted', 'value', 'text', 'display_name', 'label')
+
+# Alias -> ((group, priority), ...) index so an entry is scanned in a single pass
+# 别名 -> ((分组, 优先级), ...) 索引，使每个条目只需单次遍历
+_ALIAS_INDEX: Dict[str, tuple] = {}
+for _group, _fields in (
+    ('camera_make', _MAKE_FIELDS), ('lens_make', _LENS_MAKE_FIELDS),
+    ('camera_model', _CAMERA_FIELDS), ('lens_model', _LENS_FIELDS),
+    ('aperture', _APERTURE_FIELDS), ('shutter_speed', _SHUTTER_FIELDS),
+    ('iso', _ISO_FIELDS), ('film_stock', _FILM_FIELDS),
+    ('focal_length', _FOCAL_FIELDS), ('focal_length_35mm', _FOCAL_35MM_FIELDS),
+    ('timestamp', _TIMESTAMP_FIELDS), ('shot_date', _SHOT_DATE_FIELDS),
+    ('location', _LOCATION_FIELDS), ('frame_number', _FRAME_FIELDS),
+    ('notes', _NOTES_FIELDS),
+):
+    for _rank, _alias in enumerate(_fields):
+        _ALIAS_INDEX[_alias] = _ALIAS_INDEX.get(_alias, ()) + ((_group, _rank),)
+del _group, _fields, _rank, _alias
+
+# CSV column aliases (compatible with many header spellings) / CSV 列别名（兼容多种列名）
+# Priority for model: specific 'Model' field, then generic 'Camera' or 'Body'
+# 型号优先从 'Model' 获取，其次是通用的 'Camera' 或 'Body'
+_CSV_FIELD_MAP = (
+    ('camera_make', ('Make', 'Manufacturer')),
+    # Split Lens Make and Model
+    ('lens_make', ('LensMake',)),
+    ('camera_model', ('Model', 'model', 'Camera', 'camera', 'Body', 'body')),
+    ('lens_model', ('LensModel', 'lensmodel', 'Lensmodel', 'Lens', 'lens')),
+    ('aperture', ('Aperture', 'aperture', 'FNumber', 'fnumber', 'f-stop')),
+    ('shutter_speed', ('Shutter', 'shutter', 'ExposureTime', 'exposuretime', 'Speed')),
+    ('iso', ('ISO', 'iso', 'Sensitivity', 'sensitivity')),
+    ('film_stock', ('Film', 'film', 'FilmStock', 'filmstock', 'Emulsion')),
+    ('focal_length', ('Focal', 'focal', 'FocalLength', 'focallength')),
+    ('notes', ('Notes', 'notes', 'Comments', 'comments')),
+)
+
+# Columns whose values repeat across a roll and are interned / 在整卷中重复、需要驻留的列
+_INTERNED_ATTRS = frozenset((
+    'camera_make', 'camera_model', 'lens_make', 'lens_model',
+    'aperture', 'shutter_speed', 'iso', 'film_stock', 'focal_length',
+))
+
+
+def _extract_val(best: Dict[str, tuple], group: str) -> Any:
+    """
+    Return the winning value for a field group, unwrapping nested objects
+    返回字段分组的最优值，并展开嵌套对象
+    """
+    hit = best.get(group)
+    if hit is None:
+        return None
+    v = hit[1]
+    if isinstance(v, dict):
+        # Hunt for common value keys in nested objects
+        for key in _NESTED_VALUE_KEYS:
+            nested = v.get(key)
+            if nested:
+                return str(nested)
+        # If it's a simple key-value pair, maybe just use the first value
+        if len(v) == 1:
+            return str(next(iter(v.values())))
+    return v
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_shutter(val: float) -> str:
+    """
+    Format a numeric exposure time; memoized since cameras use a small set of speeds
+    格式化数值曝光时间（带缓存，相机快门档位数量有限）
+    """
+    if val < 1:
+        denom = round(1 / val)
+        return sys.intern(f"1/{denom}")
+    return sys.intern(f"{val:.1f}")
+
+
+def _to_frame_number(value: Any) -> Optional[int]:
+    """
+    Convert a frame value to int, pre-filtering strings instead of raising
+    将帧值转换为整数（先过滤字符串，避免抛出异常）
+    """
+    if isinstance(value, int):
+        return int(value)
+    if isinstance(value, str):
+        digits = value.strip()
+        # int() also allows '_' digit grouping / int() 还接受 '_' 数字分组
+        if not digits.lstrip('+-').replace('_', '').isdecimal():
+            return None
+        value = digits
+    try:
+        return int(value)
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
+@dataclass(slots=True)
 class MetadataEntry:
     """
     Single metadata entry / 单条元数据条目
@@ -38,6 +172,7 @@ class MetadataEntry:
     location: Optional[str] = None  # Geographic location / 地理位置
     frame_number: Optional[int] = None  # Frame/shot number / 帧编号
     notes: Optional[str] = None  # Additional notes / 附加备注
+    file_name: Optional[str] = None  # Matched photo file name (CSV import) / 匹配的照片文件名（CSV 导入）
 
 
 class MetadataParser:
@@ -80,41 +215,40 @@ class MetadataParser:
         支持 Lightme/Logbook JSON 导出格式
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if ijson is not None and os.path.getsize(file_path) > _STREAM_THRESHOLD:
+                # Stream huge exports entry by entry / 逐条流式解析超大导出文件
+                entries = self._parse_json_streaming(file_path)
+                if entries is not None:
+                    self.entries = entries
+                    logger.info(f"Parsed {len(self.entries)} entries from JSON (streamed): {file_path}")
+                    return self.entries
+            
+            # Read raw bytes; orjson parses UTF-8 bytes directly / 读取原始字节；orjson 直接解析 UTF-8 字节
+            with open(file_path, 'rb') as f:
+                data = loads(f.read())
             
             self.entries = []
             
             # Support context inheritance (e.g., top-level film stock, date)
-            context = {}
-            if isinstance(data, dict):
-                # Common top-level fields in film log exports
-                for key in ['film', 'film_stock', 'roll_name', 'camera', 'lens', 'speed', 'date', 'shot_date', 'time', 'shooting_date', 'create_time', 'lens_model', 'camera_model']:
-                    if key in data and not isinstance(data[key], (list, dict)):
-                        context[key] = data[key]
-                # Special handle for common app variations
-                if 'film' in data: context['film_stock'] = data['film']
-                if 'date' in data: context['shot_date'] = data['date']
-                if 'shooting_date' in data: context['shot_date'] = data['shooting_date']
+            context = self._extract_context(data) if isinstance(data, dict) else {}
 
             # Handle array or object wrapper / 处理数组或对象包装
             entries_data = []
             if isinstance(data, list):
                 entries_data = data
-                logger.info(f"[DEBUG] JSON is a list with {len(data)} items")
+                logger.debug("JSON is a list with %d items", len(data))
             elif isinstance(data, dict):
                 # Try common wrapper keys / 尝试常见的包装键
-                for key in ['pictures', 'entries', 'frames', 'shots', 'records', 'items']:
-                    if key in data and isinstance(data[key], list):
-                        entries_data = data[key]
-                        logger.info(f"[DEBUG] Found metadata array in key: {key}")
-                        break
+                key = next((k for k in _WRAPPER_KEYS if isinstance(data.get(k), list)), None)
+                if key is not None:
+                    entries_data = data[key]
+                    logger.debug("Found metadata array in key: %s", key)
                 
                 # If not found, deep search for the first list of objects
                 if not entries_data:
                     entries_data = self._probe_for_metadata_list(data)
                     if entries_data:
-                        logger.info(f"[DEBUG] Auto-detected metadata array via deep probe")
+                        logger.debug("Auto-detected metadata array via deep probe")
 
                 if not entries_data:
                     raise ValueError("Unknown JSON structure: Could not find metadata list")
@@ -122,9 +256,8 @@ class MetadataParser:
                 raise ValueError("JSON must be array or object")
             
             # Parse entries / 解析条目
-            logger.info(f"[DEBUG] Starting to parse {len(entries_data)} entries...")
+            logger.debug("Starting to parse %d entries...", len(entries_data))
             self.entries = [self._parse_entry(entry, context) for entry in entries_data]
-            logger.info(f"[DEBUG] Finished parsing. Total entries: {len(self.entries)}")
             
             logger.info(f"Parsed {len(self.entries)} entries from JSON: {file_path}")
             return self.entries
@@ -141,7 +274,7 @@ class MetadataParser:
                 # Strip single-line comments //
                 content = re.sub(r'//.*', '', content)
                 
-                data = json.loads(content)
+                data = loads(content)
                 self.entries = []
                 
                 # Re-run the main logic if cleaning worked
@@ -157,10 +290,9 @@ class MetadataParser:
                 if isinstance(data, list):
                     entries_data = data
                 elif isinstance(data, dict):
-                    for key in ['pictures', 'entries', 'frames', 'shots', 'records', 'items']:
-                        if key in data and isinstance(data[key], list):
-                            entries_data = data[key]
-                            break
+                    key = next((k for k in _WRAPPER_KEYS if isinstance(data.get(k), list)), None)
+                    if key is not None:
+                        entries_data = data[key]
                     if not entries_data:
                         entries_data = self._probe_for_metadata_list(data)
                 
@@ -177,6 +309,65 @@ class MetadataParser:
             logger.error(f"Error parsing JSON: {e}")
             raise
     
+    @staticmethod
+    def _extract_context(data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Collect roll-level defaults from top-level JSON fields / 从顶层 JSON 字段收集胶卷级默认值
+        """
+        context = {}
+        # Common top-level fields in film log exports
+        for key in _CONTEXT_KEYS:
+            if key in data and not isinstance(data[key], (list, dict)):
+                context[key] = data[key]
+        # Special handle for common app variations
+        if 'film' in data: context['film_stock'] = data['film']
+        if 'date' in data: context['shot_date'] = data['date']
+        if 'shooting_date' in data: context['shot_date'] = data['shooting_date']
+        return context
+    
+    def _parse_json_streaming(self, file_path: str) -> Optional[List[MetadataEntry]]:
+        """
+        Parse a large JSON export incrementally with ijson / 使用 ijson 增量解析大型 JSON 导出文件
+        
+        Entries are parsed in the same pass that reads the top-level fields, with the
+        roll context collected before the entry array. A second pass is made only when
+        context fields or a higher-priority wrapper key follow the array.
+        Returns None when no entries are found (the deep probe needs the whole document)
+        or the JSON is malformed, so the caller falls back to the full loader; no entry
+        has been parsed at that point.
+        条目与顶层字段在同一遍中解析，胶卷上下文取自条目数组之前的字段。
+        仅当上下文字段或更高优先级的包装键出现在数组之后时才进行第二遍解析。
+        未找到条目（深度探测需要完整文档）或 JSON 格式错误时返回 None，由调用方回退到完整加载；此时尚未解析任何条目。
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                # Container-valued film/date fields are built too, so the context matches the full loader
+                # 同时构建容器型的 film/date 字段，使上下文与完整加载一致
+                stream = JsonArrayStream(f, _WRAPPER_KEYS, keep=('film', 'date', 'shooting_date'))
+                context = None
+                entries = []
+                for entry in stream:
+                    if context is None:
+                        context = self._extract_context(stream.scalars)
+                    entries.append(self._parse_entry(entry, context))
+                
+                # No wrapper array, or an empty one that may hide data elsewhere; let the deep probe look
+                # 没有包装数组，或空包装数组可能意味着数据在别处，交给深度探测
+                if not entries:
+                    return None
+                
+                if stream.key:
+                    key = next(k for k in _WRAPPER_KEYS if k in stream.arrays)
+                    full_context = self._extract_context(stream.scalars)
+                    if key != stream.key or full_context != context:
+                        f.seek(0)
+                        entries = [self._parse_entry(entry, full_context) for entry in JsonArrayStream(f, (key,))]
+        except (ijson.JSONError, ValueError) as e:
+            logger.warning(f"Streaming JSON parse failed, falling back: {e}")
+            return None
+        
+        return entries or None
+    
     def _parse_csv(self, file_path: str) -> List[MetadataEntry]:
         """
         Parse CSV metadata file / 解析 CSV 元数据文件
@@ -188,15 +379,21 @@ class MetadataParser:
         try:
             self.entries = []
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
+            # Large buffer: csv pulls text in small chunks otherwise / 大缓冲区：否则 csv 会以小块读取文本
+            with open(file_path, 'r', encoding='utf-8', buffering=_READ_BUFFER_SIZE) as f:
+                reader = csv.reader(f)
                 
-                if reader.fieldnames is None:
+                # First row is the header / 第一行为表头
+                header = next(reader, None)
+                if header is None:
                     raise ValueError("CSV file is empty")
                 
-                # Map CSV headers to MetadataEntry fields / 映射 CSV 表头到 MetadataEntry 字段
+                # Map CSV headers to column positions once per file / 每个文件仅将 CSV 表头映射为列位置一次
+                columns = self._resolve_csv_columns(header)
                 for row in reader:
-                    entry = self._parse_csv_row(row)
+                    if not row:  # Skip blank lines / 跳过空行
+                        continue
+                    entry = self._parse_csv_row(row, columns)
                     self.entries.append(entry)
             
             logger.info(f"Parsed {len(self.entries)} entries from CSV: {file_path}")
@@ -206,68 +403,38 @@ class MetadataParser:
             logger.error(f"Error parsing CSV: {e}")
             raise
     
-    def _parse_csv_row(self, row: Dict[str, str]) -> MetadataEntry:
+    @staticmethod
+    def _resolve_csv_columns(header: List[str]) -> tuple:
+        """
+        Specialize the alias table to the exact column layout of the file
+        将别名表特化为文件的实际列布局
+        
+        Returns:
+            Tuple of (attribute, column indices in alias priority order, intern flag)
+            (属性, 按别名优先级排列的列索引, 是否驻留) 元组
+        """
+        # Later duplicates win, as with csv.DictReader / 重复表头以后者为准，与 csv.DictReader 一致
+        positions = {name: i for i, name in enumerate(header)}
+        columns = []
+        for attr, fields in _CSV_FIELD_MAP:
+            found = tuple(positions[f] for f in fields if f in positions)
+            if found:
+                columns.append((attr, found, attr in _INTERNED_ATTRS))
+        return tuple(columns)
+    
+    def _parse_csv_row(self, row: List[str], columns: tuple) -> MetadataEntry:
         """
         Parse a single CSV row / 解析单行 CSV
         """
         entry = MetadataEntry()
+        width = len(row)
         
-        # Field mapping / 字段映射（兼容多种列名）
-        camera_fields = ['Camera', 'camera', 'Body', 'body', 'Model', 'model']
-        lens_fields = ['Lens', 'lens', 'Lensmodel', 'lensmodel']
-        aperture_fields = ['Aperture', 'aperture', 'FNumber', 'fnumber', 'f-stop']
-        shutter_fields = ['Shutter', 'shutter', 'ExposureTime', 'exposuretime', 'Speed']
-        iso_fields = ['ISO', 'iso', 'Sensitivity', 'sensitivity']
-        film_fields = ['Film', 'film', 'FilmStock', 'filmstock', 'Emulsion']
-        focal_fields = ['Focal', 'focal', 'FocalLength', 'focallength']
-        notes_fields = ['Notes', 'notes', 'Comments', 'comments']
-        
-        # Try to extract fields / 尝试提取字段
-        entry.camera_make = row.get('Make', '') or row.get('Manufacturer', '') or None
-        
-        # Priority for model: specific 'Model' field, then generic 'Camera' or 'Body'
-        # 型号优先从 'Model' 获取，其次是通用的 'Camera' 或 'Body'
-        for field in ['Model', 'model', 'Camera', 'camera', 'Body', 'body']:
-            if field in row and row[field]:
-                entry.camera_model = row[field]
-                break
-        
-        # Split Lens Make and Model
-        entry.lens_make = row.get('LensMake', '') or None
-        for field in ['LensModel', 'lensmodel', 'Lensmodel', 'Lens', 'lens']:
-            if field in row and row[field]:
-                entry.lens_model = row[field]
-                break
-        
-        for field in aperture_fields:
-            if field in row and row[field]:
-                entry.aperture = row[field]
-                break
-        
-        for field in shutter_fields:
-            if field in row and row[field]:
-                entry.shutter_speed = row[field]
-                break
-        
-        for field in iso_fields:
-            if field in row and row[field]:
-                entry.iso = row[field]
-                break
-        
-        for field in film_fields:
-            if field in row and row[field]:
-                entry.film_stock = row[field]
-                break
-        
-        for field in focal_fields:
-            if field in row and row[field]:
-                entry.focal_length = row[field]
-                break
-        
-        for field in notes_fields:
-            if field in row and row[field]:
-                entry.notes = row[field]
-                break
+        # Try to extract fields; first non-empty alias wins / 尝试提取字段；第一个非空别名生效
+        for attr, indices, intern in columns:
+            for i in indices:
+                if i < width and row[i]:
+                    setattr(entry, attr, sys.intern(row[i]) if intern else row[i])
+                    break
         
         return entry
     
@@ -283,22 +450,20 @@ class MetadataParser:
         try:
             self.entries = []
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            for line in lines:
-                line = line.strip()
-                if not line or line.startswith('#'):  # Skip empty lines and comments
-                    continue
-                
-                # Try to split by | or tab / 尝试用 | 或 \t 分割
-                if '|' in line:
-                    fields = [f.strip() for f in line.split('|')]
-                else:
-                    fields = [f.strip() for f in line.split('\t')]
-                
-                entry = self._parse_txt_row(fields)
-                self.entries.append(entry)
+            # Lazy buffered iteration; universal newlines accept \n, \r\n and \r
+            # 惰性缓冲迭代；通用换行模式兼容 \n、\r\n 与 \r
+            with open(file_path, 'r', encoding='utf-8', newline=None, buffering=_READ_BUFFER_SIZE) as f:
+                for line in f:
+                    line = line.strip()
+                    if not line or line.startswith('#'):  # Skip empty lines and comments
+                        continue
+                    
+                    # Split by | if present, else tab; the patterns also strip each field
+                    # 优先用 | 分割，否则用 \t；预编译模式同时去除字段两侧空白
+                    fields = (_TXT_SPLIT_PIPE if '|' in line else _TXT_SPLIT_TAB).split(line)
+                    
+                    entry = self._parse_txt_row(fields)
+                    self.entries.append(entry)
             
             logger.info(f"Parsed {len(self.entries)} entries from TXT: {file_path}")
             return self.entries
@@ -316,33 +481,39 @@ class MetadataParser:
         """
         entry = MetadataEntry()
         
-        # Assign fields based on position / 基于位置分配字段
+        # Assign fields based on position; roll-level columns are interned / 基于位置分配字段；胶卷级列进行驻留
         if len(fields) > 0:
-            entry.camera_model = fields[0] or None
+            entry.camera_model = sys.intern(fields[0]) or None
         if len(fields) > 1:
-            entry.lens_model = fields[1] or None
+            entry.lens_model = sys.intern(fields[1]) or None
         if len(fields) > 2:
-            entry.aperture = fields[2] or None
+            entry.aperture = sys.intern(fields[2]) or None
         if len(fields) > 3:
-            entry.shutter_speed = fields[3] or None
+            entry.shutter_speed = sys.intern(fields[3]) or None
         if len(fields) > 4:
-            entry.iso = fields[4] or None
+            entry.iso = sys.intern(fields[4]) or None
         if len(fields) > 5:
-            entry.film_stock = fields[5] or None
+            entry.film_stock = sys.intern(fields[5]) or None
         if len(fields) > 6:
             entry.notes = fields[6] or None
         
         return entry
     
     def _probe_for_metadata_list(self, data: Any) -> Optional[List[Dict]]:
-        """Deeply probe JSON for the first list of dictionaries"""
-        if isinstance(data, list) and len(data) > 0 and isinstance(data[0], dict):
-            return data
+        """
+        Probe JSON for the shallowest list of dictionaries
+        在 JSON 中查找层级最浅的字典列表
         
-        if isinstance(data, dict):
-            for val in data.values():
-                res = self._probe_for_metadata_list(val)
-                if res: return res
+        Breadth-first and iterative, so deep documents can't hit the recursion limit.
+        采用迭代式广度优先搜索，深层文档不会触及递归上限。
+        """
+        queue = deque([data])
+        while queue:
+            node = queue.popleft()
+            if isinstance(node, list) and node and isinstance(node[0], dict):
+                return node
+            if isinstance(node, dict):
+                queue.extend(node.values())
         return None
 
     def _parse_entry(self, entry: Dict[str, Any], context: Dict[str, Any] = None) -> MetadataEntry:
@@ -361,85 +532,73 @@ class MetadataParser:
             metadata.shot_date = str(context.get('shot_date', '')) or None
             metadata.camera_make = str(context.get('camera_make', '')) or None
         
-        # Field mapping with fallbacks / 字段映射和备选项
-        # Support both Lightme format and EXIF field names (Lightroom, etc.)
-        # Make MUST NOT be in camera_fields, otherwise it overwrites Model if Model is missing or checked later
-        camera_fields = ['camera_model', 'Model', 'camera', 'body', 'camera_body', 'camera_name']
-        lens_fields = ['lens', 'lensmodel', 'lens_model', 'LensModel', 'LensMake', 'lens_name', 'optic']
-        aperture_fields = ['aperture', 'f_stop', 'f-stop', 'fnumber', 'FNumber', 'MaxApertureValue', 'f_number']
-        shutter_fields = ['shutter_speed', 'shutter', 'shutterspeed', 'exposure_time', 'exposuretime', 'ExposureTime']
-        iso_fields = ['iso', 'sensitivity', 'ISO', 'ISOSpeed', 'speed', 'film_speed', 'film_rating']
-        film_fields = ['film', 'film_stock', 'filmstock', 'emulsion', 'Description', 'ReelName', 'SpectralSensitivity', 'film_type']
-        focal_fields = ['focal_length', 'focallength', 'focal', 'FocalLength']
-        focal_35mm_fields = ['focal_length_35mm', 'focal35mm', '35mm_focal', 'FocalLengthIn35mmFormat']
-        timestamp_fields = ['timestamp', 'date', 'time', 'datetime', 'DateTimeOriginal', 'shot_time', 'shooting_date', 'create_time', 'created_at']
-        shot_date_fields = ['shot_date', 'shot_date_str', 'date_string', 'DateString', 'DateTimeOriginal', 'DateTime', 'CreateDate', 'ModifyDate', 'SubSecDateTimeOriginal', 'date', 'time', 'datetime']
-        location_fields = ['location', 'geo', 'gps', 'GPSInfo', 'GPSLatitude', 'GPSLongitude', 'GPSAltitude', 'GPSLatitudeRef', 'GPSLongitudeRef', 'place', 'address']
-        frame_fields = ['frame', 'frame_number', 'number', 'shot_number', 'ImageNumber', 'frame_id']
-        notes_fields = ['notes', 'comments', 'comment', 'UserComment', 'Notes', 'remarks', 'description']
+        # Single pass over the entry: keep the highest-priority non-empty alias per group
+        # 单次遍历条目：每个分组保留优先级最高的非空别名
+        # Bound methods hoisted into locals for the hot loop / 热循环中将绑定方法提升为局部变量
+        best = {}
+        alias_get = _ALIAS_INDEX.get
+        best_get = best.get
+        for key, v in entry.items():
+            hits = alias_get(key)
+            if hits is None or not v:
+                continue
+            for group, rank in hits:
+                cur = best_get(group)
+                if cur is None or rank < cur[0]:
+                    best[group] = (rank, v)
         
-        def extract_val(fields, entry_dict):
-            for f in fields:
-                if f in entry_dict and entry_dict[f]:
-                    v = entry_dict[f]
-                    if isinstance(v, dict):
-                        # Hunt for common value keys in nested objects
-                        for key in ['name', 'iso', 'formatted', 'value', 'text', 'display_name', 'label']:
-                            if key in v and v[key]:
-                                return str(v[key])
-                        # If it's a simple key-value pair, maybe just use the first value
-                        if len(v) == 1:
-                            return str(next(iter(v.values())))
-                    return v
-            return None
-
         # Extract fields / 提取字段
-        metadata.camera_make = entry.get('Make', '') or entry.get('Manufacturer', '') or metadata.camera_make
-        
-        val = extract_val(camera_fields, entry)
-        if val: metadata.camera_model = str(val)
+        # Roll-level values (camera, lens, film, exposure) repeat across frames, so they are
+        # interned to share one string object per distinct value
+        # 胶卷级字段（相机、镜头、胶片、曝光）在各帧间重复，驻留后每个不同值只保留一个字符串对象
+        hit = best_get('camera_make')
+        if hit is not None:
+            metadata.camera_make = sys.intern(hit[1]) if type(hit[1]) is str else hit[1]
+        
+        # Decoded JSON strings are already str; only other types pay for str()
+        # 解码后的 JSON 字符串已是 str，只有其他类型才需调用 str()
+        val = _extract_val(best, 'camera_model')
+        if val: metadata.camera_model = sys.intern(val if type(val) is str else str(val))
 
         # Split Lens Make and Model
-        metadata.lens_make = entry.get('LensMake', '') or metadata.lens_make
-        val = extract_val(lens_fields, entry)
-        if val: metadata.lens_model = str(val)
+        hit = best_get('lens_make')
+        if hit is not None:
+            metadata.lens_make = sys.intern(hit[1]) if type(hit[1]) is str else hit[1]
+        val = _extract_val(best, 'lens_model')
+        if val: metadata.lens_model = sys.intern(val if type(val) is str else str(val))
         
-        val = extract_val(aperture_fields, entry)
+        val = _extract_val(best, 'aperture')
         if val:
             if isinstance(val, (int, float)):
-                metadata.aperture = str(val)
+                metadata.aperture = sys.intern(str(val))
             else:
-                metadata.aperture = str(val).replace('f/', '').replace('F/', '').replace(' ', '')
+                metadata.aperture = sys.intern(str(val).replace('f/', '').replace('F/', '').replace(' ', ''))
 
-        val = extract_val(shutter_fields, entry)
+        val = _extract_val(best, 'shutter_speed')
         if val:
             if isinstance(val, (int, float)):
-                if val < 1:
-                    denom = round(1 / val)
-                    metadata.shutter_speed = f"1/{denom}"
-                else:
-                    metadata.shutter_speed = f"{val:.1f}"
+                metadata.shutter_speed = _format_shutter(val)
             else:
-                metadata.shutter_speed = str(val).replace('\\', '') # Fix escaped slashes
+                metadata.shutter_speed = sys.intern(str(val).replace('\\', '')) # Fix escaped slashes
 
-        val = extract_val(iso_fields, entry)
+        val = _extract_val(best, 'iso')
         if val:
             if isinstance(val, (int, float)):
-                metadata.iso = str(int(val))
+                metadata.iso = sys.intern(str(int(val)))
             else:
-                metadata.iso = str(val)
+                metadata.iso = sys.intern(val if type(val) is str else str(val))
 
-        val = extract_val(film_fields, entry)
-        if val: metadata.film_stock = str(val)
+        val = _extract_val(best, 'film_stock')
+        if val: metadata.film_stock = sys.intern(val if type(val) is str else str(val))
         
-        val = extract_val(focal_fields, entry)
+        val = _extract_val(best, 'focal_length')
         if val:
             if isinstance(val, (int, float)):
                 metadata.focal_length = f"{int(val)}mm"
             else:
                 metadata.focal_length = str(val).replace(' ', '')
         
-        val = extract_val(focal_35mm_fields, entry)
+        val = _extract_val(best, 'focal_length_35mm')
         if val:
             if isinstance(val, (int, float)):
                 metadata.focal_length_35mm = f"{int(val)}mm"
@@ -447,7 +606,7 @@ class MetadataParser:
                 metadata.focal_length_35mm = str(val).replace(' ', '')
         
         # Parse timestamp / 解析时间戳
-        val = extract_val(timestamp_fields, entry)
+        val = _extract_val(best, 'timestamp')
         if val:
             try:
                 ts_str = str(val)
@@ -459,30 +618,17 @@ class MetadataParser:
                         if val_float > 1e11: 
                             val_float /= 1000.0
                         metadata.timestamp = datetime.fromtimestamp(val_float)
-                    except:
+                    except (ValueError, OverflowError, OSError):
                         pass
                 
                 if not metadata.timestamp:
                     # Try multiple formats / 尝试多种格式
-                    formats = [
-                        '%Y-%m-%d %H:%M:%S', '%Y:%m:%d %H:%M:%S', '%Y/%m/%d %H:%M:%S',
-                        '%Y-%m-%dT%H:%M:%S%z', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%dZ',
-                        '%Y-%m-%d %H:%M', '%Y/%m/%d %H:%M',
-                        '%Y-%m-%d', '%Y/%m/%d', '%Y:%m:%d'
-                    ]
-                    for fmt in formats:
-                        try:
-                            # Standardize 'Z', 'T' and handles common variations
-                            clean_ts = ts_str.replace('Z', '+0000').replace('T', ' ').replace('/', ':').replace('-', ':')
-                            metadata.timestamp = datetime.strptime(clean_ts, fmt.replace('/', ':').replace('-', ':'))
-                            break
-                        except:
-                            continue
+                    metadata.timestamp = parse_timestamp(ts_str)
             except Exception as e:
                 logger.warning(f"Could not parse timestamp '{val}': {e}")
         
         # Parse shot date string / 解析拍摄日期字符串
-        val = extract_val(shot_date_fields, entry)
+        val = _extract_val(best, 'shot_date')
         if val: 
             val_str = str(val).strip()
             # If the "date" field is just a numeric timestamp, let fallback handle it
@@ -511,52 +657,49 @@ class MetadataParser:
             # 使用用户友好的 UI 格式；写入时再转换回 EXIF 标准
             metadata.shot_date = metadata.timestamp.strftime('%Y-%m-%d %H:%M:%S')
         
-        # Parse location / 解析地理位置
-        gps_lat = entry.get('GPSLatitude')
-        gps_lon = entry.get('GPSLongitude')
-        gps_lat_ref = entry.get('GPSLatitudeRef')
-        gps_lon_ref = entry.get('GPSLongitudeRef')
-        if gps_lat and gps_lon:
-            formatted = gps_utils.format_gps_pair(gps_lat, gps_lat_ref, gps_lon, gps_lon_ref)
-            if formatted:
-                metadata.location = formatted
-        if not metadata.location:
-            # Fallback: first available location-like field
-            for field in location_fields:
-                if field in entry and entry[field]:
-                    value = entry[field]
-                    if isinstance(value, dict):
-                        metadata.location = ', '.join(f"{k}:{v}" for k, v in value.items())
-                    elif isinstance(value, (list, tuple)):
-                        metadata.location = ', '.join(str(x) for x in value)
-                    else:
-                        loc_str = str(value).strip()
-                        # Try to standardize if it looks like coordinates (comma or semicolon)
-                        if any(c in loc_str for c in [',', ';']):
-                            sep = ';' if ';' in loc_str and ',' not in loc_str else ','
-                            parts = [p.strip() for p in loc_str.split(sep) if p.strip()]
-                            if len(parts) >= 2:
-                                formatted = gps_utils.format_gps_pair(parts[0], None, parts[1], None, strict=True)
-                                if formatted:
-                                    metadata.location = formatted
-                                    break
-                        metadata.location = loc_str
-                    break
+        # Parse location; GPS keys are read together, outside the alias pass / 解析地理位置；GPS 键需组合读取，不走别名遍历
+        # GPSLatitude/GPSLongitude are location aliases, so no location hit means nothing to probe
+        # GPSLatitude/GPSLongitude 属于位置别名，没有位置命中即无需任何探测
+        hit = best_get('location')
+        if hit is not None:
+            entry_get = entry.get
+            gps_lat = entry_get('GPSLatitude')
+            gps_lon = entry_get('GPSLongitude') if gps_lat else None
+            if gps_lat and gps_lon:
+                gps_lat_ref = entry_get('GPSLatitudeRef')
+                gps_lon_ref = entry_get('GPSLongitudeRef')
+                formatted = gps_utils.format_gps_pair(gps_lat, gps_lat_ref, gps_lon, gps_lon_ref)
+                if formatted:
+                    metadata.location = formatted
+            if not metadata.location:
+                # Fallback: highest-ranked location-like field
+                # 兜底：优先级最高的位置类字段
+                value = hit[1]
+                if isinstance(value, dict):
+                    metadata.location = ', '.join(f"{k}:{v}" for k, v in value.items())
+                elif isinstance(value, (list, tuple)):
+                    metadata.location = ', '.join(str(x) for x in value)
+                else:
+                    loc_str = str(value).strip()
+                    metadata.location = loc_str
+                    # Try to standardize if it looks like coordinates (comma, else semicolon)
+                    sep = ',' if ',' in loc_str else ';' if ';' in loc_str else None
+                    if sep is not None:
+                        parts = [p for p in _LOCATION_SPLIT[sep].split(loc_str) if p]
+                        if len(parts) >= 2:
+                            formatted = gps_utils.format_gps_pair(parts[0], None, parts[1], None, strict=True)
+                            if formatted:
+                                metadata.location = formatted
         
         # Parse frame number / 解析帧编号
-        for field in frame_fields:
-            if field in entry and entry[field]:
-                try:
-                    metadata.frame_number = int(entry[field])
-                except:
-                    pass
-                break
+        hit = best_get('frame_number')
+        if hit is not None:
+            metadata.frame_number = _to_frame_number(hit[1])
         
         # Extract notes / 提取备注
-        for field in notes_fields:
-            if field in entry and entry[field]:
-                metadata.notes = str(entry[field])
-                break
+        hit = best_get('notes')
+        if hit is not None:
+            metadata.notes = str(hit[1])
         
         return metadata
     
@@ -9,9 +9,10 @@ from PySide6.QtCore import QAbstractTableModel, Qt, QModelIndex, Signal
 from PySide6.QtGui import QPixmap, QColor, QPainter, QBrush
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
-from pathlib import Path
 import logging
+import os
 import re
+import sys
 import src.utils.gps_utils as gps_utils
 
 from src.utils.i18n import tr
@@ -19,8 +20,41 @@ from src.utils.validators import MetadataValidator
 
 logger = logging.getLogger(__name__)
 
+# Lower-case film brand/name hints for untagged UserComment text / 未标注的 UserComment 文本中的胶卷品牌/名称提示（小写）
+_FILM_KEYWORDS = ("kodak", "fuji", "ilford", "portra", "tri-x")
 
-@dataclass
+# Single-tag cell edits: column -> (EXIF tag, validator, PhotoItem attribute or None to store
+# in exif_data, write the validated value?, fallback normalizer when validation fails)
+# 单标签单元格编辑：列 -> (EXIF 标签, 验证器, PhotoItem 属性或 None 表示存入 exif_data,
+# 是否写入验证后的值, 验证失败时的兜底标准化函数)
+_COLUMN_EDITS = {
+    1: ("Make", None, None, False, None),
+    2: ("Model", MetadataValidator.validate_camera_model, None, False, None),
+    3: ("LensMake", None, None, False, None),
+    4: ("LensModel", MetadataValidator.validate_lens_model, None, False, None),
+    5: ("FNumber", MetadataValidator.validate_aperture, "aperture", False,
+        lambda v: v.replace('f/', '').replace('F/', '').replace('f', '').replace('F', '')),
+    6: ("ExposureTime", MetadataValidator.validate_shutter_speed, "shutter_speed", False, None),
+    7: ("ISO", MetadataValidator.validate_iso, "iso", False, None),
+    8: ("FocalLength", MetadataValidator.validate_focal_length, "focal_length", True, None),
+    9: ("FocalLengthIn35mmFormat", MetadataValidator.validate_focal_length, "focal_length_35mm", True, None),
+    11: ("ImageDescription", None, "location", False, None),  # Non-GPS location text / 非 GPS 位置文本
+}
+
+# EXIF tags whose values repeat across a library and are interned / 在整个图库中重复、需要驻留的 EXIF 标签
+_INTERNED_EXIF_TAGS = ("Make", "Model", "LensMake", "LensModel")
+# Longer strings are likely free text; don't pin them / 更长的字符串多为自由文本，不做驻留
+_INTERN_MAX_LEN = 64
+
+
+def _intern_short(value: Any) -> Any:
+    """Intern short strings, return anything else unchanged / 驻留短字符串，其他值原样返回"""
+    if type(value) is str and len(value) <= _INTERN_MAX_LEN:
+        return sys.intern(value)
+    return value
+
+
+@dataclass(slots=True)
 class PhotoItem:
     """
     Data structure for a single photo with metadata
@@ -43,6 +77,8 @@ class PhotoItem:
     location: Optional[str] = None  # e.g., "Tokyo, JP"
     serial_number: Optional[str] = None
     rotation: int = 0  # Rotation in degrees / 旋转角度 (0, 90, 180, 270)
+    exposure_pending: bool = False  # EXIF stored, exposure fields not parsed yet / 已缓存 EXIF，尚未解析曝光字段
+    display_cells: Optional[tuple] = None  # Cached DisplayRole strings per column / 按列缓存的显示字符串
 
 
 class PhotoDataModel(QAbstractTableModel):
@@ -72,7 +108,18 @@ class PhotoDataModel(QAbstractTableModel):
         super().__init__(parent)
         self.photos: List[PhotoItem] = []
         self.exif_cache: Dict[str, Dict[str, Any]] = {}  # Cache for EXIF data
-        self.modified_items: set = set()  # Track which items have changed
+        # Track which items have changed; a dict keeps mark order for get_modified_files
+        # 记录已修改的项；使用 dict 以便 get_modified_files 保持标记顺序
+        self.modified_items: Dict[str, None] = {}
+        self._path_to_row: Dict[str, int] = {}  # file_path -> row, for O(1) lookups / 文件路径 -> 行号，用于 O(1) 查找
+        # Translated strings, refreshed by retranslate() / 翻译后的字符串，由 retranslate() 刷新
+        self._loading_str = tr("Loading...")  # Placeholder text / 占位文本
+        self._header_labels: List[str] = [tr(c) for c in self.COLUMNS]  # Column headers / 列标题
+    
+    def retranslate(self) -> None:
+        """Refresh cached translated strings after a language switch / 切换语言后刷新缓存的翻译字符串"""
+        self._loading_str = tr("Loading...")
+        self._header_labels = [tr(c) for c in self.COLUMNS]
     
     def rowCount(self, parent=QModelIndex()) -> int:
         """Return number of rows / 返回行数"""
@@ -85,7 +132,7 @@ class PhotoDataModel(QAbstractTableModel):
     def headerData(self, section: int, orientation: Qt.Orientation, role: int) -> Any:
         """Return header data / 返回标题数据"""
         if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
-            return tr(self.COLUMNS[section])
+            return self._header_labels[section]
         return None
 
     def flags(self, index: QModelIndex) -> Qt.ItemFlags:
@@ -109,146 +156,94 @@ class PhotoDataModel(QAbstractTableModel):
         row = index.row()
         col = index.column()
         photo = self.photos[row]
+        self.ensure_parsed(photo)
+        photo.display_cells = None
         
         # New value to write / 要写入的新值
         new_value = str(value).strip()
         
-        # Mapping columns to EXIF tags and PhotoItem attributes
-        # 将列映射到 EXIF 标签和 PhotoItem 属性
-        exif_tag = None
-        attr_name = None
-        
-        try:
-            if col == 1: # C-Make
-                exif_tag = "Make"
-                photo.exif_data["Make"] = new_value
-            elif col == 2: # C-Model
-                validated = MetadataValidator.validate_camera_model(new_value)
-                exif_tag = "Model"
-                photo.exif_data["Model"] = validated
-            elif col == 3: # L-Make
-                exif_tag = "LensMake"
-                photo.exif_data["LensMake"] = new_value
-            elif col == 4: # L-Model
-                validated = MetadataValidator.validate_lens_model(new_value)
-                exif_tag = "LensModel"
-                photo.exif_data["LensModel"] = validated
-            elif col == 5: # Aperture
-                validated = MetadataValidator.validate_aperture(new_value)
-                # Clean prefix for EXIF
-                exif_val = validated.replace('f/', '').replace('F/', '').replace('f', '').replace('F', '')
-                exif_tag = "FNumber"
-                photo.aperture = validated
-            elif col == 6: # Shutter
-                validated = MetadataValidator.validate_shutter_speed(new_value)
-                exif_tag = "ExposureTime"
-                photo.shutter_speed = validated
-            elif col == 7: # ISO
-                validated = MetadataValidator.validate_iso(new_value)
-                exif_tag = "ISO"
-                photo.iso = str(validated)
-            elif col == 8: # Focal
-                validated = MetadataValidator.validate_focal_length(new_value)
-                exif_tag = "FocalLength"
-                photo.focal_length = validated
-                new_value = validated # Ensure mm is passed to EXIF write / 确保 mm 传递给 EXIF 写入
-            elif col == 9: # F35mm
-                validated = MetadataValidator.validate_focal_length(new_value)
-                exif_tag = "FocalLengthIn35mmFormat"
-                photo.focal_length_35mm = validated
-                new_value = validated
-            elif col == 10: # Film
-                # Write to both Film and UserComment for best compatibility
-                photo.film_stock = new_value
-                # Update memory immediately / 立即更新内存
-                self.dataChangedForWrite.emit(photo.file_path, {
-                    "Film": new_value,
-                    "UserComment": f"Film: {new_value}",
-                    "ImageDescription": new_value
-                })
-                self.mark_modified(photo.file_path)
-                self.dataChanged.emit(index, index)
-                return True
-            elif col == 11: # Location
-                # Handle GPS or description
+        # Columns that write several tags at once / 一次写入多个标签的列
+        if col == 10: # Film
+            # Write to both Film and UserComment for best compatibility
+            photo.film_stock = new_value
+            # Update memory immediately / 立即更新内存
+            self.dataChangedForWrite.emit(photo.file_path, {
+                "Film": new_value,
+                "UserComment": f"Film: {new_value}",
+                "ImageDescription": new_value
+            })
+            self.mark_modified(photo.file_path)
+            self.dataChanged.emit(index, index)
+            return True
+        if col == 11: # Location
+            # Handle GPS or description
+            try:
                 gps_parsed = gps_utils.parse_gps_to_exif(new_value)
-                if gps_parsed:
-                    lat, lat_ref, lon, lon_ref = gps_parsed
-                    exif_data = {
-                        "GPSLatitude": lat,
-                        "GPSLatitudeRef": lat_ref,
-                        "GPSLongitude": lon,
-                        "GPSLongitudeRef": lon_ref
-                    }
-                    photo.location = new_value
-                    self.dataChangedForWrite.emit(photo.file_path, exif_data)
-                    self.mark_modified(photo.file_path)
-                    self.dataChanged.emit(index, index)
-                    return True
-                else:
-                    # Fallback to ImageDescription if not GPS
-                    exif_tag = "ImageDescription"
-                    photo.location = new_value
-            elif col == 12: # Date
-                validated = MetadataValidator.validate_datetime(new_value)
-                exif_tag = "DateTimeOriginal"
-                # Also update CreateDate and ModifyDate
-                self.dataChangedForWrite.emit(photo.file_path, {
-                    "DateTimeOriginal": validated,
-                    "CreateDate": validated,
-                    "ModifyDate": validated
-                })
+            except ValueError as e:
+                logger.warning(f"Validation failed for column {col}: {e}")
+                return False
+            if gps_parsed:
+                lat, lat_ref, lon, lon_ref = gps_parsed
+                exif_data = {
+                    "GPSLatitude": lat,
+                    "GPSLatitudeRef": lat_ref,
+                    "GPSLongitude": lon,
+                    "GPSLongitudeRef": lon_ref
+                }
+                photo.location = new_value
+                self.dataChangedForWrite.emit(photo.file_path, exif_data)
                 self.mark_modified(photo.file_path)
                 self.dataChanged.emit(index, index)
                 return True
-        except ValueError as e:
-            logger.warning(f"Validation failed for column {col}: {e}")
-            # If validation fails, we can still try to write raw value or reject
-            if col == 5: # Aperture
-                exif_tag = "FNumber"
-                photo.aperture = new_value.replace('f/', '').replace('F/', '').replace('f', '').replace('F', '')
-            elif col == 6: # Shutter
-                exif_tag = "ExposureTime"
-                photo.shutter_speed = new_value
-            elif col == 7: # ISO
-                exif_tag = "ISO"
-                photo.iso = new_value
-            elif col == 8: # Focal
-                exif_tag = "FocalLength"
-                photo.focal_length = new_value
-            elif col == 9: # F35mm
-                exif_tag = "FocalLengthIn35mmFormat"
-                photo.focal_length_35mm = new_value
-            elif col == 12: # Date
-                exif_tag = "DateTimeOriginal"
+            # Otherwise fall back to ImageDescription via the table below
+        elif col == 12: # Date
+            try:
+                validated = MetadataValidator.validate_datetime(new_value)
+            except ValueError as e:
+                logger.warning(f"Validation failed for column {col}: {e}")
                 photo.exif_data["DateTimeOriginal"] = new_value.replace('-', ':').replace('/', ':')
-            elif col == 1: # C-Make
-                exif_tag = "Make"
-                photo.exif_data["Make"] = new_value
-            elif col == 2: # C-Model
-                exif_tag = "Model"
-                photo.exif_data["Model"] = new_value
-            elif col == 3: # L-Make
-                exif_tag = "LensMake"
-                photo.exif_data["LensMake"] = new_value
-            elif col == 4: # L-Model
-                exif_tag = "LensModel"
-                photo.exif_data["LensModel"] = new_value
-            else:
-                return False
-
-        if exif_tag:
-            # Ensure the worker thread is running / 确保工作线程处于运行状态
-            mw = self.parent()
-            if mw and hasattr(mw, 'worker_thread') and not mw.worker_thread.isRunning():
-                mw.worker_thread.start()
-                
-            self.dataChangedForWrite.emit(photo.file_path, {exif_tag: new_value})
+                return self._emit_cell_write(index, photo, "DateTimeOriginal", new_value)
+            # Also update CreateDate and ModifyDate
+            self.dataChangedForWrite.emit(photo.file_path, {
+                "DateTimeOriginal": validated,
+                "CreateDate": validated,
+                "ModifyDate": validated
+            })
             self.mark_modified(photo.file_path)
             self.dataChanged.emit(index, index)
             return True
-
-        return False
+        
+        spec = _COLUMN_EDITS.get(col)
+        if spec is None:
+            return False
+        exif_tag, validator, attr_name, write_validated, fallback = spec
+        
+        try:
+            stored = validator(new_value) if validator else new_value
+            if write_validated:
+                new_value = stored # Ensure normalized value is passed to EXIF write / 确保标准化后的值传递给 EXIF 写入
+        except ValueError as e:
+            logger.warning(f"Validation failed for column {col}: {e}")
+            # If validation fails, still write the raw value / 验证失败时仍写入原始值
+            stored = fallback(new_value) if fallback else new_value
+        
+        if attr_name:
+            setattr(photo, attr_name, str(stored))
+        else:
+            photo.exif_data[exif_tag] = stored
+        return self._emit_cell_write(index, photo, exif_tag, new_value)
+    
+    def _emit_cell_write(self, index: QModelIndex, photo: PhotoItem, exif_tag: str, value: str) -> bool:
+        """Queue a single-tag EXIF write for an edited cell / 为编辑过的单元格排队写入单个 EXIF 标签"""
+        # Ensure the worker thread is running / 确保工作线程处于运行状态
+        mw = self.parent()
+        if mw and hasattr(mw, 'worker_thread') and not mw.worker_thread.isRunning():
+            mw.worker_thread.start()
+            
+        self.dataChangedForWrite.emit(photo.file_path, {exif_tag: value})
+        self.mark_modified(photo.file_path)
+        self.dataChanged.emit(index, index)
+        return True
     
     def removeRows(self, row: int, count: int, parent: QModelIndex = QModelIndex()) -> bool:
         """Remove rows from model / 从模型中移除行"""
@@ -262,8 +257,10 @@ class PhotoDataModel(QAbstractTableModel):
             photo = self.photos.pop(i)
             if photo.file_path in self.exif_cache:
                 del self.exif_cache[photo.file_path]
-            if photo.file_path in self.modified_items:
-                self.modified_items.remove(photo.file_path)
+            self.modified_items.pop(photo.file_path, None)
+        
+        # Rows after the removed range shifted; rebuild the index / 删除范围之后的行已移位，重建索引
+        self._rebuild_path_index()
                 
         self.endRemoveRows()
         return True
@@ -282,38 +279,57 @@ class PhotoDataModel(QAbstractTableModel):
         photo = self.photos[index.row()]
         col = index.column()
         
+        if role == Qt.ItemDataRole.DisplayRole:
+            if photo.exif_data is None:
+                return photo.file_name if col == 0 else self._loading_str
+            # Views repaint far more often than photos change; format each row once
+            # 视图重绘远比照片变化频繁；每行只格式化一次
+            cells = photo.display_cells
+            if cells is None:
+                self.ensure_parsed(photo)
+                cells = photo.display_cells = tuple(
+                    self._cell_value(photo, c, role) for c in range(len(self.COLUMNS))
+                )
+            return cells[col]
+        if role == Qt.ItemDataRole.EditRole:
+            self.ensure_parsed(photo)
+            return self._cell_value(photo, col, role)
+        return None
+    
+    def _cell_value(self, photo: PhotoItem, col: int, role: int) -> Any:
+        """Format a cell for DisplayRole or EditRole / 为 DisplayRole 或 EditRole 格式化单元格"""
         if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
             if col == 0:  # File name
                 return photo.file_name
             elif col == 1:  # C-Make
                 if photo.exif_data is None:
-                    return tr("Loading...") if role == Qt.ItemDataRole.DisplayRole else ""
+                    return self._loading_str if role == Qt.ItemDataRole.DisplayRole else ""
                 val = photo.exif_data.get("Make", "")
                 return val if val else ("--" if role == Qt.ItemDataRole.DisplayRole else "")
             elif col == 2:  # C-Model
                 if photo.exif_data is None:
-                    return tr("Loading...") if role == Qt.ItemDataRole.DisplayRole else ""
+                    return self._loading_str if role == Qt.ItemDataRole.DisplayRole else ""
                 val = photo.exif_data.get("Model", "")
                 return val if val else ("--" if role == Qt.ItemDataRole.DisplayRole else "")
             elif col == 3:  # L-Make
                 if photo.exif_data is None:
-                    return tr("Loading...") if role == Qt.ItemDataRole.DisplayRole else ""
+                    return self._loading_str if role == Qt.ItemDataRole.DisplayRole else ""
                 val = photo.exif_data.get("LensMake", "")
                 return val if val else ("--" if role == Qt.ItemDataRole.DisplayRole else "")
             elif col == 4:  # L-Model
                 if photo.exif_data is None:
-                    return tr("Loading...") if role == Qt.ItemDataRole.DisplayRole else ""
+                    return self._loading_str if role == Qt.ItemDataRole.DisplayRole else ""
                 val = photo.exif_data.get("LensModel", "")
                 return val if val else ("--" if role == Qt.ItemDataRole.DisplayRole else "")
             elif col == 5:  # Aperture
                 if photo.exif_data is None:
-                    return tr("Loading...") if role == Qt.ItemDataRole.DisplayRole else ""
+                    return self._loading_str if role == Qt.ItemDataRole.DisplayRole else ""
                 if photo.aperture:
                     return photo.aperture
                 return "--" if role == Qt.ItemDataRole.DisplayRole else ""
             elif col == 6:  # Shutter
                 if photo.exif_data is None:
-                    return tr("Loading...") if role == Qt.ItemDataRole.DisplayRole else ""
+                    return self._loading_str if role == Qt.ItemDataRole.DisplayRole else ""
                 if photo.shutter_speed:
                     if role == Qt.ItemDataRole.DisplayRole:
                         if "/" in photo.shutter_speed:
@@ -322,18 +338,18 @@ class PhotoDataModel(QAbstractTableModel):
                             clean_sh = photo.shutter_speed.replace('S', '').replace('s', '').strip()
                             s_val = float(clean_sh)
                             return f"{s_val:.1f}S" if s_val >= 1.0 else f"{s_val}"
-                        except:
+                        except ValueError:
                             return photo.shutter_speed
                     return photo.shutter_speed
                 return "--" if role == Qt.ItemDataRole.DisplayRole else ""
             elif col == 7:  # ISO
                 if photo.exif_data is None:
-                    return tr("Loading...") if role == Qt.ItemDataRole.DisplayRole else ""
+                    return self._loading_str if role == Qt.ItemDataRole.DisplayRole else ""
                 val = photo.iso or ""
                 return val if val else ("--" if role == Qt.ItemDataRole.DisplayRole else "")
             elif col == 8:  # Focal
                 if photo.exif_data is None:
-                    return tr("Loading...") if role == Qt.ItemDataRole.DisplayRole else ""
+                    return self._loading_str if role == Qt.ItemDataRole.DisplayRole else ""
                 val = photo.focal_length or ""
                 if val and role == Qt.ItemDataRole.DisplayRole:
                     # Strip any trailing .0 and ensure ' mm' format if just a number
@@ -343,7 +359,7 @@ class PhotoDataModel(QAbstractTableModel):
                 return val if val else ("--" if role == Qt.ItemDataRole.DisplayRole else "")
             elif col == 9:  # F35mm
                 if photo.exif_data is None:
-                    return tr("Loading...") if role == Qt.ItemDataRole.DisplayRole else ""
+                    return self._loading_str if role == Qt.ItemDataRole.DisplayRole else ""
                 val = photo.focal_length_35mm or ""
                 if val and role == Qt.ItemDataRole.DisplayRole:
                     val = val.replace('.0 ', ' ').replace('.0', '')
@@ -352,17 +368,17 @@ class PhotoDataModel(QAbstractTableModel):
                 return val if val else ("--" if role == Qt.ItemDataRole.DisplayRole else "")
             elif col == 10:  # Film
                 if photo.exif_data is None:
-                    return tr("Loading...") if role == Qt.ItemDataRole.DisplayRole else ""
+                    return self._loading_str if role == Qt.ItemDataRole.DisplayRole else ""
                 val = photo.film_stock or ""
                 return val if val else ("--" if role == Qt.ItemDataRole.DisplayRole else "")
             elif col == 11:  # Location
                 if photo.exif_data is None:
-                    return tr("Loading...") if role == Qt.ItemDataRole.DisplayRole else ""
+                    return self._loading_str if role == Qt.ItemDataRole.DisplayRole else ""
                 val = photo.location or ""
                 return val if val else ("--" if role == Qt.ItemDataRole.DisplayRole else "")
             elif col == 12:  # Date
                 if photo.exif_data is None:
-                    return tr("Loading...") if role == Qt.ItemDataRole.DisplayRole else ""
+                    return self._loading_str if role == Qt.ItemDataRole.DisplayRole else ""
                 val = photo.exif_data.get("DateTimeOriginal", "")
                 if val and role == Qt.ItemDataRole.DisplayRole:
                     # Clean up technical formats for UI (YYYY:MM:DD -> YYYY-MM-DD)
@@ -386,13 +402,16 @@ class PhotoDataModel(QAbstractTableModel):
         start_row = len(self.photos)
         self.beginInsertRows(QModelIndex(), start_row, start_row + len(file_paths) - 1)
         
-        for file_path in file_paths:
-            photo = PhotoItem(
-                file_path=file_path,
-                file_name=Path(file_path).name,
-                status="pending"
-            )
-            self.photos.append(photo)
+        # os.path.basename is a plain string split; Path() would parse every path
+        # os.path.basename 只做字符串切分；Path() 会完整解析每个路径
+        basename = os.path.basename
+        self.photos += [
+            PhotoItem(file_path=file_path, file_name=basename(file_path), status="pending")
+            for file_path in file_paths
+        ]
+        path_to_row = self._path_to_row
+        for row, file_path in enumerate(file_paths, start_row):
+            path_to_row.setdefault(file_path, row)
         
         self.endInsertRows()
     
@@ -407,31 +426,95 @@ class PhotoDataModel(QAbstractTableModel):
         """
         # Find and update the photo item
         # 查找并更新照片项
-        for idx, photo in enumerate(self.photos):
-            if photo.file_path == file_path:
-                photo.exif_data = exif_data
-                photo.status = "loaded"
-                
-                # Parse and cache exposure data / 解析并缓存曝光数据
-                self._parse_exposure_data(photo, exif_data)
-                
-                # Notify view of data change
-                # 通知视图数据已更改
-                index = self.index(idx, 0)
-                self.dataChanged.emit(index, self.index(idx, len(self.COLUMNS) - 1))
-                break
+        idx = self._row_for_path(file_path)
+        if idx is None:
+            return
+        photo = self.photos[idx]
+        photo.exif_data = exif_data
+        photo.status = "loaded"
+        
+        # Exposure fields are parsed on first use / 曝光字段在首次使用时解析
+        photo.exposure_pending = True
+        photo.display_cells = None
+        
+        # Notify view of data change
+        # 通知视图数据已更改
+        index = self.index(idx, 0)
+        self.dataChanged.emit(index, self.index(idx, len(self.COLUMNS) - 1))
+    
+    def set_exif_data_bulk(self, updates: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Cache EXIF data for many files and notify the view once
+        为多个文件缓存 EXIF 数据，并只通知视图一次
+        
+        Args:
+            updates: Mapping of file path -> EXIF dictionary / 文件路径 -> EXIF 字典的映射
+        """
+        min_row = max_row = None
+        for file_path, exif_data in updates.items():
+            idx = self._row_for_path(file_path)
+            if idx is None:
+                continue
+            photo = self.photos[idx]
+            photo.exif_data = exif_data
+            photo.status = "loaded"
+            photo.exposure_pending = True
+            photo.display_cells = None
+            
+            min_row = idx if min_row is None else min(min_row, idx)
+            max_row = idx if max_row is None else max(max_row, idx)
+        
+        # One dataChanged over the touched span instead of one per row
+        # 对受影响的范围只发出一次 dataChanged，而不是每行一次
+        if min_row is not None:
+            self.dataChanged.emit(self.index(min_row, 0), self.index(max_row, len(self.COLUMNS) - 1))
+    
+    def _row_for_path(self, file_path: str) -> Optional[int]:
+        """
+        Return the row of a file path, or None / 返回文件路径所在的行，不存在则返回 None
+        
+        The photo list is shared with the metadata editor, which may reorder or
+        remove items in place; a stale hit triggers a rebuild of the index.
+        照片列表与元数据编辑器共享，编辑器可能原地重排或移除条目；索引失效时会重建。
+        """
+        row = self._path_to_row.get(file_path)
+        if row is None or row >= len(self.photos) or self.photos[row].file_path != file_path:
+            self._rebuild_path_index()
+            row = self._path_to_row.get(file_path)
+        return row
+    
+    def _rebuild_path_index(self) -> None:
+        """Rebuild the path -> row index; first occurrence wins / 重建路径 -> 行号索引；以首次出现为准"""
+        self._path_to_row = {}
+        for row, photo in enumerate(self.photos):
+            self._path_to_row.setdefault(photo.file_path, row)
+    
+    def ensure_parsed(self, photo: PhotoItem) -> None:
+        """
+        Parse exposure fields from cached EXIF if still pending
+        如果尚未解析，从缓存的 EXIF 中解析曝光字段
+        
+        Rows that are never painted or inspected never pay for parsing.
+        从未被绘制或查看的行无需承担解析开销。
+        """
+        if photo.exposure_pending:
+            photo.exposure_pending = False
+            self._parse_exposure_data(photo, photo.exif_data)
     
     def _parse_exposure_data(self, photo: PhotoItem, exif_data: Dict[str, Any]) -> None:
         """
         Parse and format exposure data from EXIF
         从 EXIF 解析并格式化曝光数据
         """
+        photo.display_cells = None
+        exif_get = exif_data.get
+        
         # Aperture / 光圈
         if "FNumber" in exif_data:
             try:
                 f_num = float(exif_data["FNumber"])
                 photo.aperture = f"{f_num:.1f}"
-            except:
+            except (TypeError, ValueError):
                 photo.aperture = str(exif_data["FNumber"])
         elif "Aperture" in exif_data:
             photo.aperture = str(exif_data["Aperture"])
@@ -450,7 +533,8 @@ class PhotoDataModel(QAbstractTableModel):
                         # Convert to fraction
                         denom = int(1 / exp_float)
                         photo.shutter_speed = f"1/{denom}"
-                except:
+                # 0 divides by zero, inf/nan can't become int / 0 会除零，inf/nan 无法转为整数
+                except (TypeError, ValueError, ZeroDivisionError, OverflowError):
                     photo.shutter_speed = str(exp_time)
         elif "ShutterSpeed" in exif_data:
             photo.shutter_speed = str(exif_data["ShutterSpeed"])
@@ -468,7 +552,7 @@ class PhotoDataModel(QAbstractTableModel):
                 try:
                     focal_float = float(focal)
                     photo.focal_length = f"{int(focal_float)} mm"
-                except:
+                except (TypeError, ValueError, OverflowError):
                     photo.focal_length = str(focal)
         
         # Focal Length (35mm)
@@ -477,35 +561,40 @@ class PhotoDataModel(QAbstractTableModel):
             try:
                 f35_float = float(f35)
                 photo.focal_length_35mm = f"{int(f35_float)} mm"
-            except:
+            except (TypeError, ValueError, OverflowError):
                 photo.focal_length_35mm = str(f35)
         
         # Serial Number / 序列号
-        if "SerialNumber" in exif_data:
-            photo.serial_number = str(exif_data["SerialNumber"])
+        serial = exif_get("SerialNumber")
+        if serial is not None:
+            photo.serial_number = str(serial)
         
         
         # Film Stock & Location (Film / ImageDescription / UserComment / GPS)
         # 胶卷型号和位置（Film / ImageDescription / UserComment / GPS）
+        # Each tag is fetched once; a single get replaces the "in" test plus subscript
+        # 每个标签只读取一次；一次 get 取代 "in" 判断加下标访问
         
         # First, try to read from Film field (standard EXIF field)
         # 首先尝试从 Film 字段读取（标准 EXIF 字段）
-        if "Film" in exif_data:
-            photo.film_stock = str(exif_data["Film"])
+        film = exif_get("Film")
+        if film is not None:
+            photo.film_stock = str(film)
         
-        user_comment = str(exif_data.get("UserComment", "")) if exif_data else ""
+        user_comment = str(exif_get("UserComment", ""))
 
         # Prefer GPS coordinates when available (standardized DMS string)
-        gps_lat = exif_data.get("GPSLatitude") if exif_data else None
-        gps_lon = exif_data.get("GPSLongitude") if exif_data else None
-        gps_lat_ref = exif_data.get("GPSLatitudeRef") if exif_data else None
-        gps_lon_ref = exif_data.get("GPSLongitudeRef") if exif_data else None
+        gps_lat = exif_get("GPSLatitude")
+        gps_lon = exif_get("GPSLongitude")
+        gps_lat_ref = exif_get("GPSLatitudeRef")
+        gps_lon_ref = exif_get("GPSLongitudeRef")
         gps_formatted = gps_utils.format_gps_pair(gps_lat, gps_lat_ref, gps_lon, gps_lon_ref)
         if gps_formatted:
             photo.location = gps_formatted
 
-        if "ImageDescription" in exif_data:
-            desc = str(exif_data["ImageDescription"])
+        desc = exif_get("ImageDescription")
+        if desc is not None:
+            desc = str(desc)
             # Keep description as fallback if GPS missing
             if not photo.location and desc:
                 photo.location = desc
@@ -516,24 +605,40 @@ class PhotoDataModel(QAbstractTableModel):
 
         # Parse combined user comment patterns like "Film: X | Location: Y | note"
         if user_comment:
-            parts = [p.strip() for p in user_comment.split("|") if p.strip()]
+            parts = [p for p in map(str.strip, user_comment.split("|")) if p]
             for part in parts:
-                if part.lower().startswith("film:"):
+                # Only the label prefix matters; lower-case just that / 只需前缀，仅将其转为小写
+                head = part[:9].lower()
+                if head.startswith("film:"):
                     photo.film_stock = part.split(":", 1)[1].strip() or photo.film_stock
-                elif part.lower().startswith("location:"):
+                elif head.startswith("location:"):
                     # Prefer explicit location from comment over description
                     raw_loc = part.split(":", 1)[1].strip()
                     # Improve: try to parse it as standard GPS string if it looks like one
                     # 改进：如果看起来像 GPS 字符串，尝试将其解析为标准 GPS 字符串
                     photo.location = gps_utils.parse_location_string(raw_loc) or raw_loc or photo.location
             # Fallback: if nothing parsed, but comment exists, keep as film if it looks like a film name
-            if not photo.film_stock and any(key in user_comment.lower() for key in ["kodak", "fuji", "ilford", "portra", "tri-x"]):
-                photo.film_stock = user_comment
+            if not photo.film_stock:
+                comment_lower = user_comment.lower()
+                if any(key in comment_lower for key in _FILM_KEYWORDS):
+                    photo.film_stock = user_comment
 
         # If still no location, keep any GPS fragments we have (compact)
+        # 如果仍无位置，保留已有的 GPS 片段（紧凑形式）
         if not photo.location and gps_lat and gps_lon:
             fallback = gps_utils.format_gps_pair(gps_lat, gps_lat_ref, gps_lon, gps_lon_ref, strict=False)
             photo.location = fallback or f"{gps_lat}, {gps_lon}"
+        
+        # Camera, lens, film and exposure values repeat across a library; share one object each
+        # 相机、镜头、胶卷和曝光值在图库中重复出现；每个值只共享一个对象
+        for tag in _INTERNED_EXIF_TAGS:
+            val = exif_get(tag)
+            if val is not None:
+                exif_data[tag] = _intern_short(val)
+        photo.aperture = _intern_short(photo.aperture)
+        photo.shutter_speed = _intern_short(photo.shutter_speed)
+        photo.iso = _intern_short(photo.iso)
+        photo.film_stock = _intern_short(photo.film_stock)
     
     def apply_metadata_sequentially(self, metadata_list: List[Dict[str, Any]]) -> int:
         """
@@ -558,12 +663,8 @@ class PhotoDataModel(QAbstractTableModel):
             if exif_to_write:
                 self.dataChangedForWrite.emit(photo.file_path, exif_to_write)
                 self.mark_modified(photo.file_path)
-
-            # Notify change
-            start_index = self.index(i, 0)
-            end_index = self.index(i, self.columnCount() - 1)
-            self.dataChanged.emit(start_index, end_index)
-            
+        
+        self._emit_rows_changed(range(num_to_apply))
         logger.info(f"Applied metadata sequentially to {num_to_apply} photos.")
         return num_to_apply
 
@@ -578,7 +679,7 @@ class PhotoDataModel(QAbstractTableModel):
         Returns:
             int: Number of photos updated / 已更新的照片数量
         """
-        updated_count = 0
+        updated_rows = []
         for row in row_indices:
             if 0 <= row < len(self.photos):
                 photo = self.photos[row]
@@ -587,17 +688,38 @@ class PhotoDataModel(QAbstractTableModel):
                 if exif_to_write:
                     self.dataChangedForWrite.emit(photo.file_path, exif_to_write)
                     self.mark_modified(photo.file_path)
-                    
-                # Notify change
-                start_index = self.index(row, 0)
-                end_index = self.index(row, self.columnCount() - 1)
-                self.dataChanged.emit(start_index, end_index)
-                updated_count += 1
-                
-        return updated_count
+                updated_rows.append(row)
+        
+        self._emit_rows_changed(updated_rows)
+        return len(updated_rows)
+    
+    def _emit_rows_changed(self, rows) -> None:
+        """
+        Notify the view once per contiguous run of changed rows after a bulk apply
+        批量应用后，每段连续的变更行只通知视图一次
+        
+        Args:
+            rows: Rows whose display changed / 显示内容发生变化的行
+        """
+        # One dataChanged per contiguous run of rows / 每段连续的行只发出一次 dataChanged
+        last_col = len(self.COLUMNS) - 1
+        run_start = prev = None
+        for row in sorted(set(rows)):
+            if prev is not None and row != prev + 1:
+                self.dataChanged.emit(self.index(run_start, 0), self.index(prev, last_col))
+                run_start = None
+            if run_start is None:
+                run_start = row
+            prev = row
+        if run_start is not None:
+            self.dataChanged.emit(self.index(run_start, 0), self.index(prev, last_col))
 
     def _apply_metadata_internal(self, photo, metadata: Dict[str, Any]) -> Dict[str, str]:
         """Internal helper to apply metadata to a PhotoItem / 内部辅助方法，将元数据应用到 PhotoItem"""
+        # Parse pending EXIF first so it cannot overwrite the applied values later
+        # 先解析待处理的 EXIF，避免其稍后覆盖已应用的值
+        self.ensure_parsed(photo)
+        photo.display_cells = None
         exif_to_write = {}
         
         for key, value in metadata.items():
@@ -634,7 +756,7 @@ class PhotoDataModel(QAbstractTableModel):
                     validated = MetadataValidator.validate_focal_length(str(value))
                     photo.focal_length = validated
                     exif_to_write["FocalLength"] = validated
-                except:
+                except ValueError:
                     photo.focal_length = str(value)
                     exif_to_write["FocalLength"] = str(value)
             elif key in ["FocalLengthIn35mmFormat", "F35mm", "EquivalentFocalLength"]:
@@ -642,7 +764,7 @@ class PhotoDataModel(QAbstractTableModel):
                     validated = MetadataValidator.validate_focal_length(str(value))
                     photo.focal_length_35mm = validated
                     exif_to_write["FocalLengthIn35mmFormat"] = validated
-                except:
+                except ValueError:
                     photo.focal_length_35mm = str(value)
                     exif_to_write["FocalLengthIn35mmFormat"] = str(value)
             elif key in ["FilmStock", "Film"]:
@@ -667,14 +789,45 @@ class PhotoDataModel(QAbstractTableModel):
         Args:
             file_path: Path to image file / 图像文件路径
         """
-        for idx, photo in enumerate(self.photos):
-            if photo.file_path == file_path:
-                photo.is_modified = True
-                self.modified_items.add(file_path)
-                
-                index = self.index(idx, len(self.COLUMNS) - 1)
-                self.dataChanged.emit(index, index)
-                break
+        idx = self._row_for_path(file_path)
+        if idx is None:
+            return
+        photo = self.photos[idx]
+        self.modified_items[file_path] = None
+        if photo.is_modified:
+            # Already flagged; nothing for the view to repaint / 已标记，视图无需重绘
+            return
+        photo.is_modified = True
+        
+        index = self.index(idx, len(self.COLUMNS) - 1)
+        self.dataChanged.emit(index, index)
+    
+    def mark_modified_bulk(self, file_paths: List[str]) -> None:
+        """
+        Mark many files as modified and notify the view once
+        将多个文件标记为已修改，并只通知视图一次
+        
+        Args:
+            file_paths: Paths to image files / 图像文件路径列表
+        """
+        min_row = max_row = None
+        for file_path in file_paths:
+            idx = self._row_for_path(file_path)
+            if idx is None:
+                continue
+            photo = self.photos[idx]
+            self.modified_items[file_path] = None
+            if photo.is_modified:
+                continue
+            photo.is_modified = True
+            
+            min_row = idx if min_row is None else min(min_row, idx)
+            max_row = idx if max_row is None else max(max_row, idx)
+        
+        # Same column as mark_modified, one signal for the whole span / 与 mark_modified 相同的列，整个范围只发一次信号
+        if min_row is not None:
+            last_col = len(self.COLUMNS) - 1
+            self.dataChanged.emit(self.index(min_row, last_col), self.index(max_row, last_col))
     
     def get_modified_files(self) -> List[str]:
         """Get list of modified files / 获取修改过的文件列表"""
@@ -686,6 +839,7 @@ class PhotoDataModel(QAbstractTableModel):
         self.photos.clear()
         self.exif_cache.clear()
         self.modified_items.clear()
+        self._path_to_row.clear()
         self.endResetModel()
 
 
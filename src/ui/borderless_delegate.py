@@ -7,7 +7,7 @@ Borderless Table Delegate - Custom cell renderer for DataPrism
 
 from PySide6.QtWidgets import QStyledItemDelegate, QStyle
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QPainter, QColor
+from PySide6.QtGui import QPainter, QColor, QFont
 
 
 class BorderlessDelegate(QStyledItemDelegate):
@@ -24,13 +24,29 @@ class BorderlessDelegate(QStyledItemDelegate):
         self.accent = QColor(StyleManager.c("accent"))
         # More opaque selection background for better contrast
         self.selection_bg = QColor(StyleManager.c("table_selection_bg"))
+        
+        # Cell font is the same for every cell; build it once instead of per paint
+        # 所有单元格字体相同；只构建一次，而不是每次绘制都构建
+        # Get font name and size from theme
+        font_family = StyleManager.t("family_main").strip('"')
+        
+        # USE PIXEL SIZE! Stylesheet uses pixels, delegate must match exactly.
+        # 使用像素单位！样式表使用像素，代理类必须完全匹配。
+        try:
+            font_size_str = StyleManager.t("size_tiny").replace('px', '')
+            font_size = int(font_size_str)
+        except (AttributeError, ValueError):
+            font_size = 11
+        
+        self.cell_font = QFont(font_family)
+        self.cell_font.setPixelSize(font_size)
+        self.cell_font.setWeight(QFont.Weight.Normal)
     
     def paint(self, painter, option, index):
         """
         Custom paint with proper selection background.
         自定义绘制，带有适当的选中背景。
         """
-        from src.ui.style_manager import StyleManager
         painter.save()
         
         # Enable text anti-aliasing for crisp font rendering
@@ -57,23 +73,7 @@ class BorderlessDelegate(QStyledItemDelegate):
         
         # Set font for text rendering / 设置文本渲染字体
         # Use coordinated font from StyleManager / 使用 StyleManager 中的协调字体
-        from PySide6.QtGui import QFont
-        
-        # Get font name and size from theme
-        font_family = StyleManager.t("family_main").strip('"')
-        
-        # USE PIXEL SIZE! Stylesheet uses pixels, delegate must match exactly.
-        # 使用像素单位！样式表使用像素，代理类必须完全匹配。
-        try:
-            font_size_str = StyleManager.t("size_tiny").replace('px', '')
-            font_size = int(font_size_str)
-        except:
-            font_size = 11
-        
-        font = QFont(font_family)
-        font.setPixelSize(font_size)
-        font.setWeight(QFont.Weight.Normal)
-        painter.setFont(font)
+        painter.setFont(self.cell_font)
         
         # Draw text / 绘制文字
         painter.setPen(text_color)
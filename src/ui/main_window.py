@@ -727,9 +727,9 @@ class MainWindow(QMainWindow):
         # Check if this was a bulk operation
         is_bulk = len(results) > 10
         
-        for file_path, exif_data in results.items():
-            if isinstance(exif_data, dict):
-                self.model.set_exif_data(file_path, exif_data)
+        self.model.set_exif_data_bulk(
+            {file_path: exif_data for file_path, exif_data in results.items() if isinstance(exif_data, dict)}
+        )
         
         self._is_refreshing = False
         self._refresh_inspector()
@@ -792,6 +792,7 @@ class MainWindow(QMainWindow):
             return
         row = selection[0].row()
         photo = self.model.photos[row]
+        self.model.ensure_parsed(photo)
         exif = photo.exif_data or {}
         self.info_file.setText(str(photo.file_name))
         self.info_camera_make.setText(str(exif.get("Make", "--")) if photo.exif_data else "--")
@@ -950,6 +951,7 @@ class MainWindow(QMainWindow):
     def toggle_language(self):
         """Toggle UI language between Chinese and English / 在中英文之间切换界面语言"""
         new_lang = toggle_language()
+        self.model.retranslate()
         self.refresh_ui()
         # Header refresh
         self.model.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, self.model.columnCount() - 1)
@@ -1101,8 +1103,7 @@ class MainWindow(QMainWindow):
     def on_metadata_written(self):
         """Handle metadata written successfully / 处理元数据成功写入"""
         # Mark all photos as modified / 标记所有照片为已修改
-        for photo in self.model.photos:
-            self.model.mark_modified(photo.file_path)
+        self.model.mark_modified_bulk([photo.file_path for photo in self.model.photos])
         
         # Refresh photo data in background (silent to avoid log clutter)
         file_paths = [photo.file_path for photo in self.model.photos]
@@ -245,6 +245,7 @@ class MatchPreviewDialog(QDialog):
                         thumbnail=photo.thumbnail,
                         status=photo.status,
                         is_modified=photo.is_modified,
+                        exposure_pending=photo.exposure_pending,
                         aperture=photo.aperture,
                         shutter_speed=photo.shutter_speed,
                         iso=photo.iso,
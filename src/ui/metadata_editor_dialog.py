@@ -6,6 +6,7 @@ Metadata editor dialog for previewing and modifying imported metadata
 """
 
 from typing import List, Dict, Optional
+from dataclasses import fields as dataclass_fields
 from datetime import datetime, timedelta
 import re
 import os
@@ -691,7 +692,8 @@ class MetadataEditorDialog(QDialog):
 
     def check_count_match(self):
         p_c = len(self.photos)
-        m_c = len([e for e in self.metadata_entries if any(vars(e).values())])
+        # MetadataEntry uses __slots__, so walk dataclass fields instead of vars()
+        m_c = len([e for e in self.metadata_entries if any(getattr(e, f.name) for f in dataclass_fields(e))])
         if p_c <= m_c:
             self.warning_label.setText(tr("Matched: {matched}/{total}").format(matched=m_c, total=p_c))
             self.warning_label.setStyleSheet("color: #4CAF50;")
@@ -7,7 +7,7 @@ Utility for managing ExifTool Argfiles
 
 import os
 import tempfile
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 class ArgfileManager:
     """
@@ -16,13 +16,14 @@ class ArgfileManager:
     """
     
     @staticmethod
-    def create_read_args(file_paths: List[str]) -> str:
+    def create_read_args(file_paths: List[str], tags: Optional[List[str]] = None) -> str:
         """
         Create an argfile for reading metadata from multiple files
         创建用于批量读取元数据的 argfile
         
         Args:
             file_paths: List of file paths to read / 待读取的文件路径列表
+            tags: Tags to extract (None = all tags) / 要提取的标签（None 表示全部标签）
             
         Returns:
             Path to the temporary argfile / 临时参数文件的路径
@@ -40,6 +41,11 @@ class ArgfileManager:
                 f.write("-charset\n")
                 f.write("utf8\n")
                 
+                # Restrict output to the requested tags / 仅输出请求的标签
+                if tags:
+                    for tag in tags:
+                        f.write(f"-{tag}\n")
+                
                 # Add each file path
                 for p in file_paths:
                     # Escape '#' if necessary (though ExifTool handles paths on newlines well)
@@ -50,10 +56,10 @@ class ArgfileManager:
             raise
 
     @staticmethod
-    def create_write_args(write_tasks: List[Dict[str, Any]], overwrite: bool = True, preserve_date: bool = True) -> str:
+    def build_write_args(write_tasks: List[Dict[str, Any]], overwrite: bool = True, preserve_date: bool = True) -> bytes:
         """
-        Create a complex argfile for batch writing metadata to multiple files
-        创建用于批量写入元数据的复杂 argfile
+        Build batch-write argfile content in memory (for piping via "-@ -")
+        在内存中构建批量写入的 argfile 内容（用于通过 "-@ -" 管道传入）
         
         Args:
             write_tasks: List of {'file_path': str, 'exif_data': dict} / 写入任务列表
@@ -61,48 +67,41 @@ class ArgfileManager:
             preserve_date: Whether to preserve file modification date / 是否保留修改日期
             
         Returns:
-            Path to the temporary argfile / 临时参数文件的路径
+            UTF-8 encoded argfile content / UTF-8 编码的参数文件内容
         """
-        fd, path = tempfile.mkstemp(suffix='.args', prefix='dp_write_', text=True)
+        lines = []
         
-        try:
-            with os.fdopen(fd, 'w', encoding='utf-8') as f:
-                # Global flags / 全局标志
-                if overwrite:
-                    f.write("-overwrite_original\n")
-                if preserve_date:
-                    f.write("-P\n")
-                
-                f.write("-charset\n")
-                f.write("filename=utf8\n")
-                f.write("-charset\n")
-                f.write("utf8\n")
+        # Global flags / 全局标志
+        if overwrite:
+            lines.append("-overwrite_original")
+        if preserve_date:
+            lines.append("-P")
+        
+        lines.extend(("-charset", "filename=utf8", "-charset", "utf8"))
+        
+        # Per-file tasks / 每个文件的任务
+        # Format: -Tag=Value
+        #         Filepath
+        #         -execute
+        for task in write_tasks:
+            file_path = task.get('file_path')
+            exif_data = task.get('exif_data', {})
+            
+            if not file_path:
+                continue
                 
-                # Per-file tasks / 每个文件的任务
-                # Format: -Tag=Value
-                #         Filepath
-                #         -execute
-                for task in write_tasks:
-                    file_path = task.get('file_path')
-                    exif_data = task.get('exif_data', {})
-                    
-                    if not file_path:
-                        continue
-                        
-                    for tag, value in exif_data.items():
-                        if value is not None:
-                            # Use -Tag=Value format
-                            # Note: ExifTool handles the escaping if we put them on separate lines
-                            f.write(f"-{tag}={value}\n")
-                    
-                    f.write(f"{file_path}\n")
-                    f.write("-execute\n")
-                    
-            return path
-        except Exception:
-            os.remove(path)
-            raise
-    
+            for tag, value in exif_data.items():
+                if value is not None:
+                    # Use -Tag=Value format
+                    # Note: ExifTool handles the escaping if we put them on separate lines
+                    lines.append(f"-{tag}={value}")
+            
+            lines.append(file_path)
+            lines.append("-execute")
+        
+        lines.append("")
+        return "\n".join(lines).encode('utf-8')
+
     @staticmethod
     def cleanup(path: str):
         """Clean up the temporary file / 清理临时文件"""
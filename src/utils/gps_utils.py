@@ -5,9 +5,19 @@ GPS Utility functions for parsing and formatting coordinates
 GPS 坐标解析和格式化工具函数
 """
 
+import functools
 import re
 from typing import Optional, Tuple, Union
 
+# Robust DMS regex, compiled once / 健壮的度分秒正则（仅编译一次）
+# Handles:
+# 28deg 31' 30.59" N
+# 28 31 30.59
+# 28deg 31' 30.59" N North
+# Quotes are handled by skipping non-numeric characters between parts
+# [^0-9NSEW]* skips "deg", "'", whitespace, quotes, etc.
+_GPS_DMS_RE = re.compile(r"([0-9.]+)[^0-9]+([0-9.]+)[^0-9]+([0-9.]+)[^0-9NSEW]*([NSEW])?", re.IGNORECASE)
+
 def format_gps_pair(lat: Union[float, str, None], lat_ref: Optional[str], 
                    lon: Union[float, str, None], lon_ref: Optional[str], 
                    strict: bool = True) -> Optional[str]:
@@ -34,6 +44,7 @@ def format_gps_pair(lat: Union[float, str, None], lat_ref: Optional[str],
     return f"{_format_coordinate(lat_parsed)}, {_format_coordinate(lon_parsed)}"
 
 
+@functools.lru_cache(maxsize=1024)
 def parse_location_string(location_text: str) -> Optional[str]:
     """
     Parse a raw location string and return the standardized formatted string.
@@ -41,6 +52,9 @@ def parse_location_string(location_text: str) -> Optional[str]:
     
     Useful for cleaning up "ugly" strings like "28deg 31' 30.59" N North".
     用于清理诸如 "28deg 31' 30.59" N North" 之类的"丑陋"字符串。
+    
+    Memoized: frames shot at the same spot repeat the same text.
+    已缓存：在同一地点拍摄的帧会重复相同文本。
     """
     if not location_text:
         return None
@@ -55,8 +69,10 @@ def parse_location_string(location_text: str) -> Optional[str]:
     lon_text = parts[1]
     
     # Infer refs from text content if possible / 如果可能，从文本内容推断方向
-    lat_ref = 'N' if 'N' in lat_text.upper() else ('S' if 'S' in lat_text.upper() else None)
-    lon_ref = 'E' if 'E' in lon_text.upper() else ('W' if 'W' in lon_text.upper() else None)
+    lat_upper = lat_text.upper()
+    lon_upper = lon_text.upper()
+    lat_ref = 'N' if 'N' in lat_upper else ('S' if 'S' in lat_upper else None)
+    lon_ref = 'E' if 'E' in lon_upper else ('W' if 'W' in lon_upper else None)
     
     return format_gps_pair(lat_text, lat_ref, lon_text, lon_ref, strict=True)
 
@@ -124,15 +140,7 @@ def _parse_coordinate(value, ref_hint) -> Optional[Tuple[float, Optional[float],
     
     s = str(value).strip()
     
-    # Robust Regex handles:
-    # 28deg 31' 30.59" N
-    # 28 31 30.59
-    # 28deg 31' 30.59" N North
-    # Quotes are handled by skipping non-numeric characters between parts
-    # [^0-9NSEW]* skips "deg", "'", whitespace, quotes, etc.
-    pattern = r"([0-9.]+)[^0-9]+([0-9.]+)[^0-9]+([0-9.]+)[^0-9NSEW]*([NSEW])?"
-    
-    m = re.match(pattern, s, re.IGNORECASE)
+    m = _GPS_DMS_RE.match(s)
     if m:
         deg, minute, sec, suffix = m.groups()
         suffix = suffix or (ref_hint or "").strip()[:1]
@@ -143,7 +151,9 @@ def _parse_coordinate(value, ref_hint) -> Optional[Tuple[float, Optional[float],
         dec = float(s)
         suffix = (ref_hint or "").strip()[:1].upper() if ref_hint else None
         return dec, None, None, suffix
-    except:
+    # AttributeError: non-string ref from JSON imports; treated as unparseable like any bad value
+    # AttributeError：JSON 导入中的非字符串方位参考，与其他无效值一样视为无法解析
+    except (ValueError, AttributeError):
         return None
 
 
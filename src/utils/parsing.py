@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shared JSON and timestamp parsing helpers with optional C accelerators
+共享的 JSON 与时间戳解析工具（可选使用 C 加速库）
+"""
+
+import functools
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional, Sequence, Set
+
+# Prefer orjson (C, much faster) when installed / 安装了 orjson 时优先使用（C 实现，速度更快）
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# C ISO-8601 parser: ciso8601 when installed, else the stdlib's C fromisoformat
+# C 实现的 ISO-8601 解析器：安装了 ciso8601 时使用，否则使用标准库的 fromisoformat
+try:
+    import ciso8601
+    _parse_iso = ciso8601.parse_datetime
+except ImportError:
+    _parse_iso = datetime.fromisoformat
+
+# Optional streaming parser for very large files / 可选的超大文件流式解析器
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# UTF-8 byte order mark some exporters prepend / 部分导出工具会添加的 UTF-8 字节序标记
+_UTF8_BOM = b'\xef\xbb\xbf'
+
+# Datetime formats after normalizing date/time separators to ':', keyed by (colon count, has fraction)
+# 日期/时间分隔符统一规范化为 ':' 后的格式，按（冒号数量，是否含小数秒）索引
+_TIMESTAMP_FORMATS = {
+    (4, False): '%Y:%m:%d %H:%M:%S',
+    (4, True): '%Y:%m:%d %H:%M:%S.%f',
+    (3, False): '%Y:%m:%d %H:%M',
+    (2, False): '%Y:%m:%d',
+}
+
+
+def loads(data: Any) -> Any:
+    """
+    Decode JSON text or bytes, accepting exactly what json.loads accepts
+    解码 JSON 文本或字节，可接受的输入与 json.loads 完全一致
+
+    orjson is tried first; documents it rejects but the stdlib allows
+    (NaN/Infinity, integers beyond 64 bits, a leading BOM...) are decoded by json.loads.
+    先尝试 orjson；它拒绝但标准库接受的文档（NaN/Infinity、超过 64 位的整数、BOM 等）交由 json.loads 解码。
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_timestamp(ts_str: str) -> Optional[datetime]:
+    """
+    Parse a non-numeric timestamp string, memoized since logs repeat dates heavily
+    解析非数字时间戳字符串（带缓存，日志中日期大量重复）
+
+    Accepts ISO-8601 and EXIF-style 'YYYY:MM:DD HH:MM:SS' with '-', '/' or ':'
+    date separators; only naive datetimes are returned.
+    支持 ISO-8601 及 EXIF 风格的 'YYYY:MM:DD HH:MM:SS'（日期分隔符可为 '-'、'/' 或 ':'）；仅返回无时区时间。
+
+    Args:
+        ts_str: Timestamp string / 时间戳字符串
+
+    Returns:
+        Parsed datetime, or None if unrecognized / 解析后的 datetime，无法识别时返回 None
+    """
+    # Standardize 'Z', 'T' and handles common variations
+    clean_ts = ts_str.replace('Z', '+0000').replace('T', ' ').replace('/', ':').replace('-', ':')
+
+    # Fast path for the dominant fixed-width 'YYYY:MM:DD[ HH:MM:SS]' shapes: slice + int() instead of strptime.
+    # ASCII only: strptime accepts non-ASCII digits in some fields but not others, so leave those to it
+    # 常见的定宽 'YYYY:MM:DD[ HH:MM:SS]' 格式走快速路径：切片 + int() 代替 strptime。
+    # 仅限 ASCII：strptime 只在部分字段接受非 ASCII 数字，因此交由其处理
+    n = len(clean_ts)
+    if (clean_ts.isascii() and clean_ts[4:5] == ':' and clean_ts[7:8] == ':'
+            and (n == 10 or (n == 19 and clean_ts[10] == ' ' and clean_ts[13] == ':' and clean_ts[16] == ':'))):
+        parts = (clean_ts[0:4], clean_ts[5:7], clean_ts[8:10])
+        if n == 19:
+            parts += (clean_ts[11:13], clean_ts[14:16], clean_ts[17:19])
+        if all(p.isdecimal() for p in parts):
+            try:
+                return datetime(*map(int, parts))
+            except ValueError:
+                pass  # Out-of-range field; let the general parsers decide / 字段越界，交由通用解析处理
+
+    try:
+        dt = _parse_iso(ts_str)
+        # Naive results only; aware datetimes can't be compared with EXIF times
+        # 仅接受无时区结果；带时区的时间无法与 EXIF 时间比较
+        if dt.tzinfo is None:
+            return dt
+    except ValueError:
+        pass
+
+    # Only one format can match a given shape, so try just that one
+    # 给定形态只可能匹配一种格式，因此只尝试该格式
+    fmt = _TIMESTAMP_FORMATS.get((clean_ts.count(':'), '.' in clean_ts))
+    if fmt is None:
+        return None
+    try:
+        return datetime.strptime(clean_ts, fmt)
+    except ValueError:
+        return None
+
+
+class JsonArrayStream:
+    """
+    Single-pass ijson reader for a JSON entry array
+    单遍 ijson 读取 JSON 条目数组
+
+    Iterating yields the items of a top-level array, or of the first top-level
+    wrapper key (in document order) whose value is an array; only one item is
+    built at a time. Top-level scalars (and the `keep` fields, whatever their
+    type) seen before the array are available in `scalars` while iterating;
+    after exhaustion `scalars`, `arrays` and `containers` describe the whole top level.
+    迭代时产出顶层数组的元素，或（按文档顺序）第一个值为数组的顶层包装键中的元素；
+    任意时刻只构建一个元素。迭代过程中 `scalars` 包含数组之前出现的顶层标量（以及任意类型的 `keep` 字段）；
+    迭代结束后 `scalars`、`arrays` 与 `containers` 描述完整的顶层结构。
+    """
+
+    def __init__(self, f, wrapper_keys: Sequence[str], keep: Sequence[str] = ()):
+        """
+        Args:
+            f: Binary file object positioned at the start of the document / 位于文档起始处的二进制文件对象
+            wrapper_keys: Top-level keys that may hold the entry array / 可能包含条目数组的顶层键
+            keep: Top-level keys whose array/object values are built too / 数组/对象值也需构建的顶层键
+        """
+        self._f = f
+        self._wrapper_keys = frozenset(wrapper_keys)
+        self._keep = frozenset(keep)
+        self.key: Optional[str] = None          # Streamed wrapper key, '' for a top-level array / 流式读取的包装键，顶层数组为 ''
+        self.scalars: Dict[str, Any] = {}       # Top-level scalar and kept fields / 顶层标量及保留字段
+        self.arrays: Set[str] = set()           # Top-level keys holding arrays / 值为数组的顶层键
+        self.containers: Set[str] = set()       # Top-level keys holding arrays or objects / 值为数组或对象的顶层键
+
+    def __iter__(self) -> Iterator[Any]:
+        # ijson rejects a BOM; leading whitespace is skipped by the lexer itself
+        # ijson 不接受 BOM；前导空白由词法分析器自行跳过
+        if self._f.read(len(_UTF8_BOM)) != _UTF8_BOM:
+            self._f.seek(0)
+        events = ijson.parse(self._f, use_float=True)
+
+        _, event, _ = next(events, (None, None, None))
+        if event == 'start_array':
+            self.key = ''
+            yield from self._iter_array(events)
+            return
+        if event != 'start_map':
+            raise ValueError("JSON must be array or object")
+
+        for _, event, value in events:
+            if event == 'end_map':
+                return
+            # Depth 1 is always a key followed by its value / 第 1 层总是键后紧跟其值
+            key = value
+            _, event, value = next(events)
+            if event == 'start_array':
+                self.arrays.add(key)
+                self.containers.add(key)
+                if self.key is None and key in self._wrapper_keys:
+                    self.key = key
+                    yield from self._iter_array(events)
+                    continue
+            elif event == 'start_map':
+                self.containers.add(key)
+            else:
+                self.scalars[key] = value
+                continue
+            
+            if key in self._keep:
+                self.scalars[key] = self._build(events, event, value)
+            else:
+                self._skip(events)
+
+    @staticmethod
+    def _iter_array(events) -> Iterator[Any]:
+        """Yield array items until the matching end_array / 逐个产出数组元素直到对应的 end_array"""
+        for _, event, value in events:
+            if event == 'end_array':
+                return
+            if event in ('start_map', 'start_array'):
+                yield JsonArrayStream._build(events, event, value)
+            else:
+                yield value
+
+    @staticmethod
+    def _build(events, event: str, value: Any) -> Any:
+        """Build the container opened by (event, value) / 构建由 (event, value) 开启的容器"""
+        builder = ijson.ObjectBuilder()
+        builder.event(event, value)
+        depth = 1
+        while depth:
+            _, event, value = next(events)
+            if event in ('start_map', 'start_array'):
+                depth += 1
+            elif event in ('end_map', 'end_array'):
+                depth -= 1
+            builder.event(event, value)
+        return builder.value
+
+    @staticmethod
+    def _skip(events) -> None:
+        """Consume events up to the end of the current container / 消费事件直到当前容器结束"""
+        depth = 1
+        for _, event, _ in events:
+            if event in ('start_map', 'start_array'):
+                depth += 1
+            elif event in ('end_map', 'end_array'):
+                depth -= 1
+                if not depth:
+                    return
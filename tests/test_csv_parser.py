@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the CSV import parser
+CSV 导入解析器测试
+"""
+
+import pytest
+
+from src.core.csv_parser import CSVParser
+
+# (CSV text, expected (headers, rows)); expectations come from the csv.DictReader implementation
+# （CSV 文本，期望的 (列标题, 数据行)）；期望值取自 csv.DictReader 实现
+_CASES = {
+    "strip": (
+        " Camera , Lens ,ISO\n AE-1 , 50mm ,400\nFM2,35mm,100\n",
+        (["Camera", "Lens", "ISO"], [{"Camera": "AE-1", "Lens": "50mm", "ISO": "400"},
+                                     {"Camera": "FM2", "Lens": "35mm", "ISO": "100"}]),
+    ),
+    "semicolon": (
+        "Camera;Lens;ISO\nAE-1;50mm;400\n",
+        (["Camera", "Lens", "ISO"], [{"Camera": "AE-1", "Lens": "50mm", "ISO": "400"}]),
+    ),
+    "tab": (
+        "Camera\tLens\nAE-1\t50mm\n",
+        (["Camera", "Lens"], [{"Camera": "AE-1", "Lens": "50mm"}]),
+    ),
+    # Missing trailing cells are None / 缺失的尾部单元格为 None
+    "short_rows": (
+        "Camera,Lens,ISO\nAE-1\nFM2,35mm\n",
+        (["Camera", "Lens", "ISO"], [{"Camera": "AE-1", "Lens": None, "ISO": None},
+                                     {"Camera": "FM2", "Lens": "35mm", "ISO": None}]),
+    ),
+    "blank_lines": (
+        "Camera,Lens\n\nAE-1,50mm\n\n\n",
+        (["Camera", "Lens"], [{"Camera": "AE-1", "Lens": "50mm"}]),
+    ),
+    # Later duplicate headers win / 重复表头以后者为准
+    "duplicate_header": (
+        "Camera, Camera ,Lens\na,b,c\n",
+        (["Camera", "Camera", "Lens"], [{"Camera": "b", "Lens": "c"}]),
+    ),
+    "empty_header_cell": (
+        "Camera,,Lens\na,b,c\n",
+        (["Camera", "", "Lens"], [{"Camera": "a", "": "b", "Lens": "c"}]),
+    ),
+    "quoted": (
+        'Camera,Notes\n"F3, HP"," multi\nline "\n',
+        (["Camera", "Notes"], [{"Camera": "F3, HP", "Notes": "multi\nline"}]),
+    ),
+    "header_only": (
+        "Camera,Lens\n",
+        (["Camera", "Lens"], []),
+    ),
+    "empty_cells": (
+        "Camera,Lens\n,\n",
+        (["Camera", "Lens"], [{"Camera": "", "Lens": ""}]),
+    ),
+}
+
+
+def _parse(tmp_path, text):
+    path = tmp_path / "import.csv"
+    path.write_bytes(text.encode("utf-8"))
+    return CSVParser(str(path)).parse()
+
+
+@pytest.mark.parametrize("text,expected", _CASES.values(), ids=_CASES.keys())
+def test_parse(tmp_path, text, expected):
+    """Positional parsing matches csv.DictReader with cleaned keys and values / 按位置解析与清理键值后的 csv.DictReader 一致"""
+    assert _parse(tmp_path, text) == expected
+
+
+def test_parse_extra_cells(tmp_path):
+    """Extra cells go under a None key, unstripped, as csv.DictReader does (used to raise AttributeError)
+    多余单元格按 csv.DictReader 的方式存于 None 键下且不去除空白（以前抛出 AttributeError）"""
+    assert _parse(tmp_path, "Camera,Lens\nAE-1,50mm,x, y \n") == (
+        ["Camera", "Lens"], [{"Camera": "AE-1", "Lens": "50mm", None: ["x", " y "]}])
+
+
+def test_parse_empty_file(tmp_path):
+    """An empty file yields no headers and no rows (used to raise TypeError) / 空文件返回空列标题与空行（以前抛出 TypeError）"""
+    assert _parse(tmp_path, "") == ([], [])
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+The batch read whitelist must cover every EXIF tag the UI consumes
+批量读取白名单必须覆盖界面使用的所有 EXIF 标签
+"""
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from src.core.exif_worker import ExifToolWorker  # noqa: E402
+from src.core.json_matcher import _DATE_FIELDS  # noqa: E402
+from src.core.photo_model import PhotoDataModel, PhotoItem  # noqa: E402
+
+# Tags read directly by the inspector panel and the match dialog / 检查器面板和匹配对话框直接读取的标签
+_UI_READ_TAGS = (
+    "Make", "Model", "LensMake", "LensModel", "Film", "FocalLength",
+    "FocalLengthIn35mmFormat", "GPSLatitude", "GPSLongitude", "ImageDescription",
+    "DateTimeOriginal", "CreateDate",
+)
+
+
+class _RecordingDict(dict):
+    """Dict that records every key looked up / 记录所有被查询键的字典"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.seen = set()
+
+    def __contains__(self, key):
+        self.seen.add(key)
+        return super().__contains__(key)
+
+    def __getitem__(self, key):
+        self.seen.add(key)
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        self.seen.add(key)
+        return super().get(key, default)
+
+
+@pytest.fixture(scope="module")
+def requested_tags():
+    return set(ExifToolWorker("exiftool")._batch_read_tags)
+
+
+def test_model_reads_only_requested_tags(requested_tags):
+    """Both the populated and the fallback branches of the EXIF parser / EXIF 解析的取值分支与回退分支"""
+    full = {tag: "1" for tag in requested_tags}
+    for exif in (_RecordingDict(full), _RecordingDict()):
+        photo = PhotoItem(file_path="/tmp/a.jpg", file_name="a.jpg", exif_data=exif)
+        PhotoDataModel._parse_exposure_data(None, photo, exif)
+        assert exif.seen <= requested_tags, sorted(exif.seen - requested_tags)
+
+
+def test_ui_and_matcher_tags_are_requested(requested_tags):
+    missing = (set(_UI_READ_TAGS) | set(_DATE_FIELDS)) - requested_tags
+    assert not missing, sorted(missing)
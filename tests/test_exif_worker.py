@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the ExifTool worker
+ExifTool 工作线程测试
+"""
+
+import json
+import types
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+import src.core.exif_worker as exif_worker  # noqa: E402
+
+
+@pytest.fixture
+def worker(monkeypatch):
+    """Worker with sleeps recorded instead of slept / 记录而非实际执行等待的工作器"""
+    sleeps = []
+    monkeypatch.setattr(exif_worker.time, "sleep", sleeps.append)
+    w = exif_worker.ExifToolWorker("exiftool")
+    w.MAX_RETRIES = 3
+    w.sleeps = sleeps
+    return w
+
+
+def _fake_run(monkeypatch, stderr, returncode=1):
+    """Patch subprocess.run to fail with the given stderr; returns the call log / 让 subprocess.run 以指定 stderr 失败"""
+    calls = []
+
+    def run(*args, **kwargs):
+        calls.append(args)
+        return types.SimpleNamespace(returncode=returncode, stdout=b"", stderr=stderr)
+
+    monkeypatch.setattr(exif_worker.subprocess, "run", run)
+    return calls
+
+
+def test_permanent_error_is_not_retried(worker, monkeypatch):
+    calls = _fake_run(monkeypatch, b"Error: File not found - missing.jpg\n")
+
+    with pytest.raises(RuntimeError, match="File not found"):
+        worker._run_exiftool_with_retry(["exiftool"])
+
+    assert len(calls) == 1
+    assert worker.sleeps == []
+
+
+@pytest.mark.parametrize("stderr", [b"Error: Error opening file - locked.jpg\n", b""])
+def test_other_errors_retry_with_exponential_backoff(worker, monkeypatch, stderr):
+    calls = _fake_run(monkeypatch, stderr)
+
+    with pytest.raises(RuntimeError, match="after 3 attempts"):
+        worker._run_exiftool_with_retry(["exiftool"])
+
+    assert len(calls) == 3
+    assert worker.sleeps == [worker.RETRY_DELAY, worker.RETRY_DELAY * 2]
+
+
+def test_read_exif_maps_source_file_to_first_matching_input(worker, monkeypatch, tmp_path):
+    """SourceFile is matched to inputs by normalized path; the first equivalent input wins
+    SourceFile 按规范化路径匹配输入；多个等价输入中第一个生效"""
+    photo = tmp_path / "a.jpg"
+    inputs = [str(photo), str(tmp_path) + "/./a.jpg", "relative/b.jpg"]
+    stdout = json.dumps([
+        {"SourceFile": str(photo), "Model": "AE-1"},
+        {"SourceFile": "relative/./b.jpg", "Model": "FM2"},
+        {"SourceFile": "/elsewhere/c.jpg", "Model": "F3"},
+    ]).encode("utf-8")
+    monkeypatch.setattr(exif_worker.subprocess, "run",
+                        lambda *a, **k: types.SimpleNamespace(returncode=0, stdout=stdout, stderr=b""))
+    finished = []
+    worker.read_finished.connect(finished.append)
+
+    worker.read_exif(inputs)
+
+    assert {path: entry["Model"] for path, entry in finished[0].items()} == {
+        str(photo): "AE-1",
+        "relative/b.jpg": "FM2",
+        "/elsewhere/c.jpg": "F3",  # Unmatched results keep ExifTool's path / 未匹配的结果保留 ExifTool 的路径
+    }
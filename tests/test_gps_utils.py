@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for GPS coordinate parsing and formatting
+GPS 坐标解析与格式化测试
+"""
+
+import pytest
+
+import src.utils.gps_utils as gps_utils
+from src.core.metadata_parser import MetadataParser
+
+
+@pytest.mark.parametrize("ref", [0.008, 1, ["N"], {"r": 1}])
+def test_non_string_ref_on_decimal_coordinate_is_unparseable(ref):
+    """Non-string refs make the coordinate unparseable instead of raising / 非字符串方位参考视为无法解析，而不是抛出异常"""
+    assert gps_utils.format_gps_pair("35.6", ref, "139.7", "E") is None
+    assert gps_utils.format_gps_pair("35.6", "N", "139.7", ref) is None
+
+
+def test_json_entry_with_numeric_gps_ref_still_imports():
+    entry = MetadataParser()._parse_entry(
+        {"GPSLatitude": "35.6", "GPSLongitude": "139.7", "GPSLatitudeRef": 0.008}
+    )
+    assert entry is not None
+
+
+def test_decimal_and_dms_pairs_format():
+    assert gps_utils.format_gps_pair("35.6", "N", "139.7", "E") == "35.600000N, 139.700000E"
+    assert gps_utils.format_gps_pair("28deg 31' 30.59\" N", None, "119deg 30' 30.44\" E", None) == "28°31'31\"N, 119°30'30\"E"
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the film log JSON parser
+胶片日志 JSON 解析器测试
+"""
+
+import pytest
+
+from src.core.json_parser import FilmLogParser
+
+
+# (entry, expected frame number); expectations come from calling int() on every value
+# （条目，期望帧编号）；期望值取自对每个值直接调用 int() 的结果
+@pytest.mark.parametrize("entry,expected", [
+    ({"frame": "7"}, 7),
+    ({"frame": " +7 "}, 7),
+    ({"frame": "-3"}, -3),
+    ({"frame": "007"}, 7),
+    ({"frame": "1_000"}, 1000),
+    ({"frame": "٣"}, 3),           # Non-ASCII decimal digits / 非 ASCII 十进制数字
+    ({"frame": 2.8}, 2),
+    ({"frame": True}, 1),
+    ({"frame": "1e3"}, None),
+    ({"frame": "1.0"}, None),
+    ({"frame": "_1"}, None),
+    ({"frame": "²"}, None),
+    ({"frame": [1]}, None),
+    # The first present key decides, even when empty / 由第一个存在的键决定，即使为空
+    ({"frame": "x", "frame_number": 5}, None),
+    ({"frame": "", "number": 4}, None),
+    ({"frame": 0, "frame_number": 5}, 0),
+    ({"shot_number": 2}, 2),
+])
+def test_frame_number(entry, expected):
+    """Pre-filtered strings convert exactly as int() would / 预过滤后的字符串转换结果与 int() 完全一致"""
+    assert FilmLogParser()._parse_entry(entry).frame_number == expected
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+The ijson streaming path must produce exactly what the full loader produces
+ijson 流式解析路径的结果必须与完整加载完全一致
+"""
+
+import json
+
+import pytest
+
+pytest.importorskip("ijson")
+
+import src.core.json_parser as json_parser  # noqa: E402
+import src.core.metadata_parser as metadata_parser  # noqa: E402
+
+_LAYOUTS = {
+    "top_level_array": [{"frame": 1, "camera": "A", "iso": 400, "date": "2024-01-02"}, {"frame": 2, "lens": "L"}],
+    "context_before": {"film": "Portra", "date": "2024-05-01", "entries": [{"frame": 1, "iso": "400"}, {"frame": 2}]},
+    "context_after": {"entries": [{"frame": 1}, {"frame": 2, "camera": "B"}], "film": "HP5", "camera": "Leica"},
+    "priority_later": {"shots": [{"frame": 9}], "frames": [{"frame": 1}], "entries": [{"frame": 5, "camera": "Z"}]},
+    "other_containers": {"meta": {"x": [1, 2]}, "frames": [{"frame": 1, "notes": "n", "location": {"lat": 1}}]},
+    "film_container": {"film": {"name": "Ektar"}, "entries": [{"frame": 1}]},
+    "film_container_after": {"entries": [{"frame": 1}], "film": {"name": "Ektar"}, "date": ["2024"]},
+    "nested_entries": {"entries": [{"frame": 1, "location": {"lat": 1.5, "lon": 2}, "tags": [1, [2, {"a": 3}]]}]},
+    "empty_wrapper": {"entries": [], "data": {"list": [{"frame": 3}]}},
+    "deep_probe": {"data": {"list": [{"frame": 3}]}},
+}
+
+
+def _parse(monkeypatch, module, make_parser, path, threshold):
+    monkeypatch.setattr(module, "_STREAM_THRESHOLD", threshold)
+    try:
+        return make_parser().parse_file(str(path))
+    except ValueError as e:
+        return ("error", str(e))
+
+
+@pytest.mark.parametrize("name", sorted(_LAYOUTS))
+@pytest.mark.parametrize("module, make_parser", [
+    (json_parser, json_parser.FilmLogParser),
+    (metadata_parser, metadata_parser.MetadataParser),
+], ids=["film_log", "metadata"])
+def test_streamed_matches_full_loader(tmp_path, monkeypatch, module, make_parser, name):
+    path = tmp_path / f"{name}.json"
+    path.write_text(json.dumps(_LAYOUTS[name]))
+
+    full = _parse(monkeypatch, module, make_parser, path, 1 << 62)
+    streamed = _parse(monkeypatch, module, make_parser, path, 0)
+
+    assert streamed == full
+
+
+def test_stream_skips_bom_and_long_leading_whitespace(tmp_path):
+    path = tmp_path / "bom.json"
+    path.write_bytes(b"\xef\xbb\xbf" + b" \n" * 100 + json.dumps(_LAYOUTS["context_before"]).encode())
+
+    entries = metadata_parser.MetadataParser()._parse_json_streaming(str(path))
+
+    assert [e.frame_number for e in entries] == [1, 2]
+    assert entries[0].film_stock == "Portra"
+
+
+@pytest.mark.parametrize("name", ["empty_wrapper", "deep_probe"])
+def test_stream_defers_to_full_loader_without_entries(tmp_path, name):
+    path = tmp_path / f"{name}.json"
+    path.write_text(json.dumps(_LAYOUTS[name]))
+
+    assert metadata_parser.MetadataParser()._parse_json_streaming(str(path)) is None
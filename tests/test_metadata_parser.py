@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the TXT/CSV/JSON metadata parser
+TXT/CSV/JSON 元数据解析器测试
+"""
+
+import dataclasses
+import json
+from datetime import datetime
+
+import pytest
+
+from src.core.metadata_parser import MetadataParser
+
+_TXT_ROWS = [
+    "# Camera | Lens | Aperture | Shutter | ISO | Film | Notes",
+    "Canon AE-1 | 50mm f/1.8 | f/2.8 | 1/125 | 400 | Kodak Portra 400 | Portrait",
+    "",
+    "Nikon FM2\t35mm f/2\tf/8\t1/250\t100\tFuji Acros\tStreet",
+]
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n", "\r"], ids=["lf", "crlf", "cr"])
+def test_parse_txt_line_endings(tmp_path, newline):
+    """Every newline convention yields the same rows / 各种换行约定解析出相同的行"""
+    path = tmp_path / "roll.txt"
+    path.write_bytes(newline.join(_TXT_ROWS).encode("utf-8"))
+
+    entries = MetadataParser().parse_file(str(path))
+
+    assert len(entries) == 2
+    assert entries[0].camera_model == "Canon AE-1"
+    assert entries[0].notes == "Portrait"
+    assert entries[1].camera_model == "Nikon FM2"
+    assert entries[1].film_stock == "Fuji Acros"
+    # No stray carriage return survives in the last field / 最后一个字段不残留回车符
+    assert entries[1].notes == "Street"
+
+
+def test_parse_txt_empty_file(tmp_path):
+    """An empty file parses to no entries / 空文件解析为空列表"""
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+
+    assert MetadataParser().parse_file(str(path)) == []
+
+
+def _fields(entry):
+    """Non-empty fields of a MetadataEntry, without raw data / MetadataEntry 的非空字段（不含原始数据）"""
+    return {f.name: getattr(entry, f.name) for f in dataclasses.fields(entry)
+            if f.name != "raw_data" and getattr(entry, f.name) not in (None, "")}
+
+
+# (entry, context, expected fields); expectations come from the per-alias scan the index replaced
+# （条目，上下文，期望字段）；期望值取自被别名索引取代的逐别名扫描
+_JSON_ALIAS_CASES = [
+    # Highest-priority non-empty alias wins regardless of key order / 无论键顺序，优先级最高的非空别名胜出
+    ({"camera": "Body B", "Model": "Model A", "camera_model": ""}, None, {"camera_model": "Model A"}),
+    ({"camera_body": "X", "body": "Y"}, None, {"camera_model": "Y"}),
+    ({"Make": "Canon", "Manufacturer": "Nikon", "Model": "AE-1"}, None, {"camera_make": "Canon", "camera_model": "AE-1"}),
+    ({"lens_name": "N", "LensModel": "M", "lens": 0}, None, {"lens_model": "M"}),
+    ({"speed": 200, "film_speed": 400}, None, {"iso": "200"}),
+    ({"sensitivity": None, "speed": "800"}, None, {"iso": "800"}),
+    ({"frame": 3, "frame_number": 9, "notes": "a", "remarks": "b"}, None, {"frame_number": 3, "notes": "a"}),
+    ({"ImageNumber": "12", "description": "desc", "Notes": ""}, None, {"frame_number": 12, "notes": "desc"}),
+    ({"focal35mm": 52, "focal_length_35mm": "", "35mm_focal": "50 mm"}, None, {"focal_length_35mm": "52mm"}),
+    # One key feeding two groups / 同一个键属于两个分组
+    ({"LensMake": "Zeiss", "optic": "Planar 50"}, None, {"lens_make": "Zeiss", "lens_model": "Zeiss"}),
+    ({"date": "2024-01-02 10:00:00", "DateTimeOriginal": "2023:05:06 07:08:09"}, None,
+     {"timestamp": datetime(2024, 1, 2, 10, 0), "shot_date": "2023-05-06 07:08:09"}),
+    ({"DateTime": "2023:05:06 07:08:09", "time": "2024-01-02T10:00:00"}, None,
+     {"timestamp": datetime(2024, 1, 2, 10, 0), "shot_date": "2023-05-06 07:08:09"}),
+    # Nested objects and numbers / 嵌套对象与数字
+    ({"film": {"name": "Portra 400"}, "lens": {"k": "v"}, "camera": {"a": 1, "b": 2}}, None,
+     {"camera_model": "{'a': 1, 'b': 2}", "lens_model": "v", "film_stock": "Portra 400"}),
+    ({"emulsion": {"value": "HP5"}, "film_stock": {}}, None, {"film_stock": "HP5"}),
+    ({"aperture": 2.8, "shutter": 0.008, "iso": 400.0, "focal_length": 50.0}, None,
+     {"aperture": "2.8", "shutter_speed": "1/125", "iso": "400", "focal_length": "50mm"}),
+    ({"FNumber": "f/ 8", "ExposureTime": "1\\/250", "ISO": "100", "focal": "35 mm"}, None,
+     {"aperture": "8", "shutter_speed": "1/250", "iso": "100", "focal_length": "35mm"}),
+    ({"GPSLatitude": 35.6, "location": "", "place": "Tokyo"}, None, {"location": "35.6"}),
+    ({"location": "35.6, 139.7"}, None, {"location": "35.600000, 139.700000"}),
+    # Aliases are case-sensitive / 别名区分大小写
+    ({"unknown": "x", "Camera": "case-sensitive"}, None, {}),
+    # Context defaults and entry overrides / 上下文默认值及条目覆盖
+    ({"frame": 1}, {"camera": "Ctx Cam", "lens": "Ctx Lens", "film_stock": "Ctx Film", "speed": 100},
+     {"camera_model": "Ctx Cam", "lens_model": "Ctx Lens", "iso": "100", "film_stock": "Ctx Film", "frame_number": 1}),
+    ({"frame": 1, "camera": "Own", "film": "Own Film"}, {"camera": "Ctx Cam", "film_stock": "Ctx Film"},
+     {"camera_model": "Own", "film_stock": "Own Film", "frame_number": 1}),
+]
+
+
+@pytest.mark.parametrize("entry,context,expected", _JSON_ALIAS_CASES)
+def test_parse_entry_alias_resolution(entry, context, expected):
+    """The single-pass alias index picks the same values as probing each alias in turn / 单遍别名索引与逐个探测别名的结果一致"""
+    assert _fields(MetadataParser()._parse_entry(entry, context)) == expected
+
+
+def test_parse_json_file_with_context(tmp_path):
+    """Top-level fields fill in what an entry lacks / 顶层字段补全条目缺失的值"""
+    path = tmp_path / "roll.json"
+    path.write_text(json.dumps({
+        "film": "Ilford HP5", "camera": "Nikon FM2", "date": "2024-03-04", "frames": [
+            {"frame": 1, "lens": "50mm", "aperture": 2, "shutter_speed": "1/60"},
+            {"frame": 2, "film": "Override", "Model": "F3", "timestamp": "2024-03-04T12:30:00"},
+        ],
+    }), encoding="utf-8")
+
+    entries = MetadataParser().parse_file(str(path))
+
+    assert [_fields(e) for e in entries] == [
+        {"camera_model": "Nikon FM2", "lens_model": "50mm", "aperture": "2", "shutter_speed": "1/60",
+         "film_stock": "Ilford HP5", "shot_date": "2024-03-04", "frame_number": 1},
+        {"camera_model": "F3", "film_stock": "Override", "timestamp": datetime(2024, 3, 4, 12, 30),
+         "shot_date": "2024-03-04", "frame_number": 2},
+    ]
+
+
+def _parse_csv_text(tmp_path, text):
+    path = tmp_path / "roll.csv"
+    path.write_bytes(text.encode("utf-8"))
+    return [_fields(e) for e in MetadataParser().parse_file(str(path))]
+
+
+# (CSV text, expected fields per row); expectations come from the per-row alias probing of csv.DictReader rows
+# （CSV 文本，每行期望字段）；期望值取自对 csv.DictReader 行逐个探测别名的结果
+_CSV_ALIAS_CASES = {
+    "priority": (
+        "Body,Camera,Model,lens,LensModel,Make,Manufacturer,LensMake\n"
+        "B1,C1,M1,l1,LM1,,Nikon,Zeiss\n"
+        "B2,C2,,l2,,Canon,,\n",
+        [{"camera_make": "Nikon", "camera_model": "M1", "lens_make": "Zeiss", "lens_model": "LM1"},
+         {"camera_make": "Canon", "camera_model": "C2", "lens_model": "l2"}],
+    ),
+    "empty_cell_fallback": (
+        "ISO,Sensitivity,Film,Emulsion,Speed,ExposureTime,Focal,FocalLength,Notes,comments\n"
+        ",200,,HP5,1/60,1/125,,35mm,,c\n"
+        "400,,Portra,,1/60,,50mm,,n,\n",
+        [{"shutter_speed": "1/125", "iso": "200", "film_stock": "HP5", "focal_length": "35mm", "notes": "c"},
+         {"shutter_speed": "1/60", "iso": "400", "film_stock": "Portra", "focal_length": "50mm", "notes": "n"}],
+    ),
+    # Later duplicate headers win, even when empty / 重复表头以后者为准，即使为空
+    "duplicate_header": (
+        "Camera,Lens,Camera\nfirst,L,second\nfirst,L,\n",
+        [{"camera_model": "second", "lens_model": "L"}, {"lens_model": "L"}],
+    ),
+    # Headers are matched exactly: no case folding or stripping / 表头精确匹配：不忽略大小写、不去除空白
+    "exact_match": (
+        "CAMERA,Iso,Aperture,f-stop, ISO\nX,100,,f/8,200\n",
+        [{"aperture": "f/8"}],
+    ),
+    "utf8_bom": (
+        "\ufeffCamera,Lens\nAE-1,50mm\n",
+        [{"lens_model": "50mm"}],
+    ),
+}
+
+
+@pytest.mark.parametrize("text,expected", _CSV_ALIAS_CASES.values(), ids=_CSV_ALIAS_CASES.keys())
+def test_parse_csv_alias_resolution(tmp_path, text, expected):
+    """Columns resolved once per file pick the same cells as probing every row / 每个文件解析一次的列映射与逐行探测的结果一致"""
+    assert _parse_csv_text(tmp_path, text) == expected
+
+
+def test_parse_csv_row_shapes(tmp_path):
+    """Blank lines are skipped, short rows leave fields unset, extra cells are ignored, quoted cells survive
+    空行被跳过，短行的缺失字段保持未设置，多余单元格被忽略，带引号的单元格保持完整"""
+    text = 'Camera,Lens,Aperture\n\nAE-1,50mm,2.8\nFM2\n\n"F3, HP","Nikkor\n50",4,extra,cells\n,,\n'
+
+    assert _parse_csv_text(tmp_path, text) == [
+        {"camera_model": "AE-1", "lens_model": "50mm", "aperture": "2.8"},
+        {"camera_model": "FM2"},
+        {"camera_model": "F3, HP", "lens_model": "Nikkor\n50", "aperture": "4"},
+        {},  # A row of empty cells is not blank / 全为空单元格的行不算空行
+    ]
+
+
+def test_parse_csv_header_only(tmp_path):
+    """A header without rows parses to no entries / 只有表头的文件解析为空列表"""
+    assert _parse_csv_text(tmp_path, "Camera,Lens\n") == []
+
+
+def test_parse_csv_blank_first_line(tmp_path):
+    """A blank first line is an empty header, so no column matches / 首行为空时表头为空，没有列能匹配"""
+    assert _parse_csv_text(tmp_path, "\nCamera,Lens\nAE-1,50mm\n") == [{}, {}]
+
+
+def test_parse_csv_empty_file(tmp_path):
+    """An empty CSV file is an error / 空 CSV 文件视为错误"""
+    with pytest.raises(ValueError, match="CSV file is empty"):
+        _parse_csv_text(tmp_path, "")
+
+
+# (entry, expected frame number); unlike the film log parser, empty values fall through to the next alias
+# （条目，期望帧编号）；与胶片日志解析器不同，空值会落到下一个别名
+@pytest.mark.parametrize("entry,expected", [
+    ({"frame": " +7 "}, 7),
+    ({"frame": "1_000"}, 1000),
+    ({"frame": "٣"}, 3),
+    ({"frame": 2.8}, 2),
+    ({"frame": "1e3"}, None),
+    ({"frame": "_1"}, None),
+    ({"frame": "²"}, None),
+    ({"frame": "x", "frame_number": 5}, None),
+    ({"frame": "", "number": 4}, 4),
+    ({"frame": 0, "frame_number": 5}, 5),
+    ({"ImageNumber": "9", "shot_number": 2}, 2),
+])
+def test_parse_entry_frame_number(entry, expected):
+    """Pre-filtered strings convert exactly as int() would / 预过滤后的字符串转换结果与 int() 完全一致"""
+    assert MetadataParser()._parse_entry(entry).frame_number == expected
+
+
+def _parse_txt_text(tmp_path, text):
+    path = tmp_path / "roll.txt"
+    path.write_bytes(text.encode("utf-8"))
+    return [_fields(e) for e in MetadataParser().parse_file(str(path))]
+
+
+# (TXT text, expected fields per line); expectations come from split() followed by strip() on each field
+# （TXT 文本，每行期望字段）；期望值取自先 split() 再逐字段 strip() 的结果
+_TXT_SPLIT_CASES = {
+    "pipe_whitespace": (
+        "AE-1 |50mm|  f/2  |1/60|400|HP5|note with | pipe\n",
+        [{"camera_model": "AE-1", "lens_model": "50mm", "aperture": "f/2", "shutter_speed": "1/60",
+          "iso": "400", "film_stock": "HP5", "notes": "note with"}],
+    ),
+    # Empty tab columns keep their position / 空的制表符列保留其位置
+    "tab_empty_columns": (
+        "AE-1\t\t\t1/60\t\tHP5\t\n",
+        [{"camera_model": "AE-1", "shutter_speed": "1/60", "film_stock": "HP5"}],
+    ),
+    "tab_whitespace": (" AE-1 \t 50mm \t f/2\n", [{"camera_model": "AE-1", "lens_model": "50mm", "aperture": "f/2"}]),
+    "unicode_whitespace": ("AE-1\u00a0|\u00a050mm\n", [{"camera_model": "AE-1", "lens_model": "50mm"}]),
+    "tab_unicode_whitespace": ("AE-1\t\u3000\t50mm\n", [{"camera_model": "AE-1", "aperture": "50mm"}]),
+    # A pipe anywhere takes precedence over tabs / 只要存在竖线就优先于制表符
+    "pipe_over_tab": ("AE-1\tx | 50mm\n", [{"camera_model": "AE-1\tx", "lens_model": "50mm"}]),
+    "spaces_are_not_separators": ("AE-1  50mm  f/2\n", [{"camera_model": "AE-1  50mm  f/2"}]),
+    "empty_fields": ("|||||\n", [{}]),
+    "extra_fields": (
+        "a|b|c|d|e|f|g|h|i\n",
+        [{"camera_model": "a", "lens_model": "b", "aperture": "c", "shutter_speed": "d",
+          "iso": "e", "film_stock": "f", "notes": "g"}],
+    ),
+    "comments": ("# AE-1 | x\n  # indented | comment\nFM2 | 35mm\n", [{"camera_model": "FM2", "lens_model": "35mm"}]),
+}
+
+
+@pytest.mark.parametrize("text,expected", _TXT_SPLIT_CASES.values(), ids=_TXT_SPLIT_CASES.keys())
+def test_parse_txt_field_splitting(tmp_path, text, expected):
+    """Precompiled separator patterns split and strip like split() + strip() / 预编译分隔符模式的分割与去空白结果与 split() + strip() 一致"""
+    assert _parse_txt_text(tmp_path, text) == expected
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the shared JSON and timestamp parsing helpers
+共享 JSON 与时间戳解析工具测试
+"""
+
+import json
+import math
+from datetime import datetime
+
+import pytest
+
+from src.core.json_parser import FilmLogParser
+from src.utils.parsing import loads
+
+
+def test_loads_accepts_what_the_stdlib_accepts():
+    """The optional orjson accelerator must not reject stdlib-valid JSON / 可选的 orjson 加速不得拒绝标准库可解析的 JSON"""
+    data = loads(b'{"iso": NaN, "ev": -Infinity, "id": 123456789012345678901234567890}')
+    assert math.isnan(data["iso"])
+    assert data["ev"] == -math.inf
+    assert data["id"] == 123456789012345678901234567890
+    assert loads(b'\xef\xbb\xbf[1]') == [1]
+    assert loads('{"a": [1, 2]}') == {"a": [1, 2]}
+
+
+def test_loads_still_raises_json_decode_error():
+    with pytest.raises(json.JSONDecodeError):
+        loads(b'{"a": ')
+
+
+def test_film_log_with_nan_parses_like_baseline(tmp_path):
+    path = tmp_path / "log.json"
+    path.write_text('{"entries": [{"frame": 1, "iso": NaN, "timestamp": "2024-01-02T10:00:00", "camera": "Leica M6"}]}')
+
+    (entry,) = FilmLogParser().parse_file(str(path))
+
+    assert (entry.frame_number, entry.iso, entry.camera) == (1, "nan", "Leica M6")
+    assert entry.timestamp == datetime(2024, 1, 2, 10, 0, 0)
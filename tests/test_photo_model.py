@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for bulk metadata application in the photo table model
+照片表格模型批量应用元数据的测试
+"""
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from src.core.photo_model import PhotoDataModel  # noqa: E402
+
+_PATHS = ["/photos/001.jpg", "/photos/002.jpg", "/photos/003.jpg", "/photos/004.jpg"]
+
+
+@pytest.fixture
+def model():
+    m = PhotoDataModel()
+    m.add_photos(_PATHS)
+    m.writes = []
+    m.changed = []
+    m.dataChangedForWrite.connect(lambda path, exif: m.writes.append((path, exif)))
+    # Full-row repaints only; mark_modified repaints the status cell separately / 仅记录整行重绘；mark_modified 单独重绘状态单元格
+    m.dataChanged.connect(
+        lambda top, bottom, *roles: top.column() == 0 and m.changed.append((top.row(), bottom.row()))
+    )
+    return m
+
+
+def test_apply_to_rows_writes_each_row_and_coalesces_view_updates(model):
+    updated = model.apply_metadata_to_rows([0, 1, 3], {"ISO": "400", "Film": "Kodak Portra 400"})
+
+    assert updated == 3
+    assert [path for path, _ in model.writes] == [_PATHS[0], _PATHS[1], _PATHS[3]]
+    assert model.writes[0][1]["ISO"] == "400"
+    assert model.get_modified_files() == [_PATHS[0], _PATHS[1], _PATHS[3]]
+    # One full-row repaint per contiguous run / 每段连续行只整行重绘一次
+    assert model.changed == [(0, 1), (3, 3)]
+
+
+def test_apply_sequentially_stops_at_the_shorter_list(model):
+    applied = model.apply_metadata_sequentially([{"ISO": "100"}, {}, {"ISO": "400"}])
+
+    assert applied == 3
+    # Empty metadata produces no write / 空元数据不产生写入
+    assert [path for path, _ in model.writes] == [_PATHS[0], _PATHS[2]]
+    assert model.get_modified_files() == [_PATHS[0], _PATHS[2]]
+    assert model.changed == [(0, 2)]
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Regression tests for timestamp parsing in the JSON metadata and film log parsers
+JSON 元数据解析器与胶片日志解析器的时间戳解析回归测试
+
+Expected values were produced by the parsers before timestamp parsing was shared
+and memoized; cases whose result changed on purpose are listed separately.
+期望值取自时间戳解析共享并缓存之前的解析器；有意改变结果的用例单独列出。
+"""
+
+from datetime import datetime
+
+import pytest
+
+from src.core.json_parser import FilmLogParser
+from src.core.metadata_parser import MetadataParser
+from src.utils.parsing import parse_timestamp
+
+# Accepted by both old parsers; results must not change / 两个旧解析器均接受；结果不得改变
+_UNCHANGED = [
+    ("2024-01-02 10:00:00", datetime(2024, 1, 2, 10, 0)),
+    ("2024/01/02 10:00:00", datetime(2024, 1, 2, 10, 0)),
+    ("2024-01-02T10:00:00", datetime(2024, 1, 2, 10, 0)),
+    ("2024-01-02T10:00", datetime(2024, 1, 2, 10, 0)),
+    ("2024-01-02 10:00", datetime(2024, 1, 2, 10, 0)),
+    ("2024/01/02 10:00", datetime(2024, 1, 2, 10, 0)),
+    ("2024-01-02", datetime(2024, 1, 2)),
+    ("2024/01/02", datetime(2024, 1, 2)),
+    ("2024-1-2 7:05:09", datetime(2024, 1, 2, 7, 5, 9)),
+    ("2024-1-2", datetime(2024, 1, 2)),
+]
+
+# Rejected by both old parsers and still rejected / 两个旧解析器均拒绝，现在仍然拒绝
+_REJECTED = [
+    "2024-01-02T10:00:00Z",       # Aware datetimes are never returned / 从不返回带时区的时间
+    "2024-01-02T10:00:00+08:00",
+    "2024-01-02Z",
+    "2024-13-02",
+    "2024-02-30 10:00:00",
+    "2024-01-02 24:00:00",
+    "24-01-02",
+    "abc",
+]
+
+# Broadened on purpose: (input, old MetadataParser result, old FilmLogParser result, new result)
+# 有意放宽：（输入，旧 MetadataParser 结果，旧 FilmLogParser 结果，新结果）
+_BROADENED = [
+    # EXIF ':' date separators, formerly MetadataParser only / EXIF 的 ':' 日期分隔符，以前仅 MetadataParser 支持
+    ("2024:01:02 10:00:00", datetime(2024, 1, 2, 10, 0), None, datetime(2024, 1, 2, 10, 0)),
+    ("2024:01:02", datetime(2024, 1, 2), None, datetime(2024, 1, 2)),
+    # Fractional seconds, formerly FilmLogParser with '-' only / 小数秒，以前仅 FilmLogParser 支持且仅限 '-'
+    ("2024-01-02 10:00:00.123", None, datetime(2024, 1, 2, 10, 0, 0, 123000), datetime(2024, 1, 2, 10, 0, 0, 123000)),
+    ("2024-01-02T10:00:00.5", None, datetime(2024, 1, 2, 10, 0, 0, 500000), datetime(2024, 1, 2, 10, 0, 0, 500000)),
+    ("2024:01:02 10:00:00.123456", None, None, datetime(2024, 1, 2, 10, 0, 0, 123456)),
+    # Basic-format ISO-8601, accepted by the ISO parser / 基本格式的 ISO-8601，由 ISO 解析器接受
+    ("20240102T100000", None, None, datetime(2024, 1, 2, 10, 0)),
+]
+
+
+def _metadata_ts(value):
+    return MetadataParser()._parse_entry({"timestamp": value}).timestamp
+
+
+def _film_log_ts(value):
+    return FilmLogParser()._parse_entry({"timestamp": value}).timestamp
+
+
+@pytest.mark.parametrize("text,expected", _UNCHANGED)
+def test_unchanged_formats(text, expected):
+    """Formats both old parsers accepted parse to the same value / 旧解析器均接受的格式结果不变"""
+    assert _metadata_ts(text) == expected
+    assert _film_log_ts(text) == expected
+    assert parse_timestamp(text) == expected
+
+
+@pytest.mark.parametrize("text", _REJECTED)
+def test_rejected_formats(text):
+    """Unrecognized, invalid and timezone-aware strings still yield None / 无法识别、非法及带时区的字符串仍返回 None"""
+    assert _metadata_ts(text) is None
+    assert _film_log_ts(text) is None
+    assert parse_timestamp(text) is None
+
+
+@pytest.mark.parametrize("text,old_metadata,old_film_log,expected", _BROADENED)
+def test_broadened_formats(text, old_metadata, old_film_log, expected):
+    """Both parsers now accept the union of the old formats plus basic ISO-8601 / 两个解析器现在接受旧格式的并集及基本 ISO-8601"""
+    assert (old_metadata, old_film_log) != (expected, expected)
+    assert _metadata_ts(text) == expected
+    assert _film_log_ts(text) == expected
+
+
+def test_compact_date_only():
+    """'YYYYMMDD' stays a Unix timestamp in MetadataParser; FilmLogParser now reads it as a date (was None)
+    'YYYYMMDD' 在 MetadataParser 中仍视为 Unix 时间戳；FilmLogParser 现在将其解析为日期（以前为 None）"""
+    assert _metadata_ts("20240102") == datetime.fromtimestamp(20240102)
+    assert _film_log_ts("20240102") == datetime(2024, 1, 2)
+
+
+@pytest.mark.parametrize("value", [1700000000, 1700000000.5, "1700000000", 1700000000123, "1700000000123"])
+def test_metadata_numeric_timestamps(value):
+    """Numeric values are still checked first, milliseconds included / 仍优先检查数字值（包括毫秒）"""
+    seconds = float(value)
+    if seconds > 1e11:
+        seconds /= 1000.0
+    assert _metadata_ts(value) == datetime.fromtimestamp(seconds)
+
+
+def test_film_log_numeric_timestamps():
+    """FilmLogParser still only converts numbers, not numeric strings / FilmLogParser 仍只转换数字，不转换数字字符串"""
+    assert _film_log_ts(1700000000) == datetime.fromtimestamp(1700000000)
+    assert _film_log_ts(1700000000.5) == datetime.fromtimestamp(1700000000.5)
+    assert _film_log_ts("1700000000") is None
+    assert _film_log_ts(1700000000123) is None  # Out of range, as before / 越界，与之前一致
+
+
+def test_parse_timestamp_is_memoized():
+    """Repeated strings are served from the cache / 重复的字符串由缓存返回"""
+    parse_timestamp("2031-05-06 07:08:09")
+    hits = parse_timestamp.cache_info().hits
+    assert parse_timestamp("2031-05-06 07:08:09") == datetime(2031, 5, 6, 7, 8, 9)
+    assert parse_timestamp.cache_info().hits == hits + 1
+
+
+# Shapes the old multi-format loops handled; one strptime format per shape must agree
+# 旧的多格式循环处理过的形态；按形态选择单一 strptime 格式后结果必须一致
+@pytest.mark.parametrize("text", [
+    "2024-01-02 10:00:00 ",       # Trailing space / 尾随空格
+    " 2024-01-02",                # Leading space / 前导空格
+    "2024.01.02",
+    "1.5.2024",
+    "2024-01-02 10:00:00.",
+    "2024-01-02T10:00:00.123Z",
+])
+def test_unmatched_shapes(text):
+    """Shapes no format matches are still rejected / 没有格式匹配的形态仍被拒绝"""
+    assert _metadata_ts(text) is None
+    assert _film_log_ts(text) is None
+
+
+@pytest.mark.parametrize("text", ["2024-01/02 10:00:00", "2024-01-02 10-00-00"])
+def test_mixed_separators(text):
+    """Mixed separators normalize as MetadataParser always did; FilmLogParser used to return None
+    混合分隔符按 MetadataParser 一贯的方式规范化；FilmLogParser 以前返回 None"""
+    assert _metadata_ts(text) == datetime(2024, 1, 2, 10, 0)
+    assert _film_log_ts(text) == datetime(2024, 1, 2, 10, 0)
+
+
+@pytest.mark.parametrize("text", ["2024-01-02T10", "2024-01-02 10"])
+def test_hour_only_iso(text):
+    """Reduced-precision ISO-8601 times are now accepted; both old parsers returned None
+    现在接受降低精度的 ISO-8601 时间；两个旧解析器均返回 None"""
+    assert _metadata_ts(text) == datetime(2024, 1, 2, 10, 0)
+    assert _film_log_ts(text) == datetime(2024, 1, 2, 10, 0)
+
+
+# Fixed-width 'YYYY-MM-DD HH:MM:SS' strings skip strptime; results must match it exactly
+# 定宽 'YYYY-MM-DD HH:MM:SS' 字符串跳过 strptime；结果必须与其完全一致
+@pytest.mark.parametrize("text,expected", [
+    ("2024-02-29 12:00:00", datetime(2024, 2, 29, 12, 0)),
+    ("2023-02-29 00:00:00", None),         # Out-of-range fields fall through / 越界字段交由通用解析
+    ("2024-01-02 23:59:60", None),
+    ("2024-01-02 10:60:00", None),
+    ("0000-01-02 10:00:00", None),
+    ("+024-01-02 10:00:00", None),         # Signs are not digits / 符号不是数字
+    ("2024-+1-02 10:00:00", None),
+    ("2024-01-02 +1:00:00", None),
+    # strptime takes non-ASCII digits in some fields only / strptime 只在部分字段接受非 ASCII 数字
+    ("２０２４-01-02 10:00:00", datetime(2024, 1, 2, 10, 0)),
+    ("2024-01-02 1０:00:00", datetime(2024, 1, 2, 10, 0)),
+    ("2024-01-02 10:00:0٣", datetime(2024, 1, 2, 10, 0, 3)),
+    ("2024-0１-02 10:00:00", None),
+])
+def test_fixed_width_datetime(text, expected):
+    """The slicing fast path agrees with strptime / 切片快速路径与 strptime 结果一致"""
+    assert _metadata_ts(text) == expected
+    assert _film_log_ts(text) == expected
+
+
+# Date-only 'YYYY-MM-DD' strings take the same fast path / 仅日期的 'YYYY-MM-DD' 字符串走同一快速路径
+@pytest.mark.parametrize("text,expected", [
+    ("2024-02-29", datetime(2024, 2, 29)),
+    ("9999-12-31", datetime(9999, 12, 31)),
+    ("2024/01/02", datetime(2024, 1, 2)),
+    ("2024-1-02", datetime(2024, 1, 2)),   # Not fixed-width; strptime handles it / 非定宽，由 strptime 处理
+    ("2023-02-29", None),
+    ("2024-00-10", None),
+    ("2024-01-32", None),
+    ("0000-01-01", None),
+    ("+024-01-02", None),
+    ("2024-01-+2", None),
+    ("2024-01-2 ", None),
+    ("２０２４-01-02", datetime(2024, 1, 2)),
+    ("2024-01-0２", None),
+])
+def test_fixed_width_date(text, expected):
+    """The slicing fast path agrees with strptime / 切片快速路径与 strptime 结果一致"""
+    assert _metadata_ts(text) == expected
+    assert _film_log_ts(text) == expected